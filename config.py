@@ -103,6 +103,41 @@ FONT_MESSAGE_OVERLAY = (FONT_FAMILY_PRIMARY, 12, "normal")
 
 # --- Slider Debouncing Interval ---
 SLIDER_DEBOUNCE_INTERVAL = 0.25
+SLIDER_SEEK_DEBOUNCE_MS = 80 # Quiet time the seek worker waits for before a keyboard-driven slider seek
+SLIDER_RELEASE_COALESCE_S = 0.3 # A release this soon after the press seek, at the same spot, does not seek again
+
+# --- Background Workers ---
+IO_WORKER_COUNT = 2 # Daemon workers for one-shot upload/image/model-load jobs
+
+# --- Playback Decoding ---
+VIDEO_HW_DECODE = True # Ask OpenCV's FFMPEG backend for GPU decode (CUDA/D3D11/VAAPI/VideoToolbox); falls back to software
+VIDEO_HW_DEVICE = 0
+DECODE_QUEUE_SIZE = 8 # Frames decoded ahead of the playback loop
+REALTIME_MAX_FRAME_STRIDE = 4 # Real-time inference shows at most every Nth frame when it cannot keep up
+PLAYBACK_UI_UPDATE_INTERVAL_MS = 100 # Slider/label refresh period during playback (10 Hz)
+
+# --- Scrubbing Preview ---
+# Uploaded videos are transcoded in the background (if ffmpeg is on PATH) to an all-keyframe
+# MJPEG copy used only for paused slider seeks; inference always reads the original.
+PREVIEW_HEIGHT = 540
+PREVIEW_MJPEG_QUALITY = 5
+PREVIEW_MAX_DURATION_S = 300 # Longer videos get no preview (bounds temp disk use and transcode time)
+PREVIEW_FFMPEG_THREADS = 1 # Keeps the transcode from starving the playback decoder and inference
+
+# --- Toast Notifications ---
+TOAST_DURATION_MS = 3000
+TOAST_WRAP_LENGTH = 320
+
+# --- Model Cache ---
+MODEL_CACHE_SIZE = 3 # Loaded models kept resident (bounds VRAM on GPU)
+MODEL_WARMUP_IMAGE_SIZE = 640 # Side of the blank image used for the post-load warmup pass
+
+# --- Threshold Reprocessing ---
+# Images are run once at these permissive settings; slider changes then only re-filter and re-run NMS.
+RAW_CANDIDATE_CONF = 0.001
+RAW_CANDIDATE_IOU = 0.99
+RAW_CANDIDATE_MAX_DET = 1000
+DETECTION_MAX_DET = 300 # Boxes kept after re-filtering; matches Ultralytics' predict() default
 
 # --- Default Thresholds ---
 DEFAULT_IOU_THRESHOLD = 0.45
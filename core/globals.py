@@ -1,12 +1,27 @@
+import queue
 import threading
+from collections import namedtuple, OrderedDict
+from app import config
 
 # --- Global State for Video Processing ---\n",
 video_thread = None 
 stop_video_processing_flag = threading.Event() 
-video_paused_flag = threading.Event()
+video_paused = False # Only read by the after-loop on the Tk thread; a plain bool avoids Event lock overhead
 current_video_frame = None 
 video_capture_global = None 
+playback_start_token = 0 # Bumped on the Tk thread by play/stop/upload; a background capture open publishes only if it still matches
 video_access_lock = threading.Lock() 
+inference_lock = threading.Lock() # Serializes predict/track on the shared model (playback, seek display, uploads)
+video_capture_cache = {} # file_path -> opened cv2.VideoCapture, reused across play/stop/seek
+CaptureInfo = namedtuple('CaptureInfo', 'fps total_frames width height')
+capture_info_cache = {} # file_path -> CaptureInfo, read once when the capture is opened
+av_container_cache = {} # file_path -> PyAV input container used for keyframe seeks (only if PyAV is installed)
+frame_queue = queue.Queue(maxsize=config.DECODE_QUEUE_SIZE) # (generation, frame_number, frame) from the read-ahead decoder
+decode_generation = 0 # Bumped whenever the capture moves; decoded frames from older generations are stale
+decoder_thread = None
+decoder_thread_generation = -1
+decoder_skip_frames = 0 # Frames the decoder should grab() past before its next read (processed-video catch-up)
+frame_skip_stride = 1 # Real-time inference reads every Nth frame; the rest are grab()bed without decoding
 is_playing_via_after_loop = False 
 after_id_playback_loop = None 
 
@@ -19,6 +34,7 @@ real_time_fps_display_value = 0.0
 fast_video_processing_thread = None
 stop_fast_processing_flag = threading.Event()
 processed_video_temp_file_path_global = None 
+processed_video_ready_event = threading.Event() # Set once the processed file is closed and synced; cleared when it is discarded
 fast_processing_active_flag = threading.Event()
 
 # --- Global State for Slider Debouncing ---\n",
@@ -26,6 +42,7 @@ slider_debounce_timer = None
 slider_target_frame_value = 0 
 is_programmatic_slider_update = False
 is_slider_being_dragged = False
+progress_slider_width = 0 # Cached from <Configure> so slider clicks avoid a winfo_width() round trip
 
 # --- Global State for Seek Optimization ---
 seek_operation_lock = threading.Lock()
@@ -42,18 +59,29 @@ conf_threshold_global = 0.25
 
 active_model_key = None
 active_model_object_global = None
+model_cache = OrderedDict() # (model_key, path) -> {'model', 'class_list', 'device'}, least recently used first
 active_class_list_global = {}
 active_processed_class_filter_global = None
 device_to_use = 'cpu'
 
 
 # --- UI State and File Info ---\n",
-current_video_meta = {'fps': 0.0, 'total_frames': 0, 'duration_seconds': 0.0, 'current_frame': 0} 
+current_video_meta = {'fps': 0.0, 'total_frames': 0, 'duration_seconds': 0.0, 'current_frame': 0}
+VideoMeta = namedtuple('VideoMeta', 'fps total_frames duration_s')
+video_meta_snapshot = VideoMeta(0.0, 0, 0.0) # Immutable; rebound (never mutated) so per-frame readers need no lock 
 uploaded_file_info = {} 
 current_uploaded_file_path_global = None
+preview_video_path = None # MJPEG scrubbing preview of preview_source_path, once the transcode finishes
+preview_source_path = None
+preview_transcode_process = None # Running ffmpeg Popen for the current upload's preview; killed on a new upload or exit
+last_upload_dir = None # Directory of the last chosen upload, reused as the file dialog's initialdir
 
 current_processed_image_for_display = None
 current_unprocessed_image_for_display = None
+uploaded_image_bgr = None # Decoded upload, reused by threshold/model reprocessing
+raw_yolo_result = None # Low-threshold candidates for uploaded_image_bgr, keyed by source image and model
+cached_first_frame_bgr = None
+cached_first_photoimage = None
 fps_global = 0.0
 total_frames_global = 0
 current_frame_number_global = 0
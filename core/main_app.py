@@ -4,9 +4,8 @@ This module initializes and launches the application.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 import sys
-import threading
 
 from app import config
 from app.core import globals as app_globals
@@ -20,6 +19,7 @@ from app.processing.model_loader import (
 )
 from app.ui.elements import create_ui_components
 from app.ui.handlers.loading_manager import show_loading, hide_loading_and_update_controls
+from app.ui.handlers import shared_refs as refs
 from app.ui.callbacks import init_callbacks
 
 
@@ -47,17 +47,14 @@ def setup_model_selector(ui_components_dict):
         """Handle radio button selection to show/hide custom model frame."""
         selected_model = model_var.get()
         custom_model_frame = ui_components_dict.get("custom_model_frame")
-        custom_model_button = ui_components_dict.get("custom_model_button")
         
         if custom_model_frame:
             if selected_model == "Select Custom Model":
                 custom_model_frame.pack(fill="x", pady=config.SPACING_SMALL, padx=config.SPACING_MEDIUM)
-                if custom_model_button:
-                    custom_model_button.state(['!disabled'])
+                refs.set_button_state("custom_model_button", False)
             else:
                 custom_model_frame.pack_forget()
-                if custom_model_button:
-                    custom_model_button.state(['disabled'])
+                refs.set_button_state("custom_model_button", True)
 
     for i, model_key in enumerate(model_keys):
         # Make custom model option more descriptive
@@ -117,13 +114,18 @@ def on_close(root_win, from_exception=False):
     on_close.stopping = True
 
     from app.ui.callbacks import _stop_all_processing_logic
+    from app.processing.video_handler import evict_cached_captures, _cleanup_preview_video_file
     _stop_all_processing_logic()
+    with app_globals.video_access_lock:
+        evict_cached_captures()
+    _cleanup_preview_video_file()
 
     if root_win and root_win.winfo_exists():
         log_debug("Destroying root window.")
         root_win.destroy()
     else:
         log_debug("Root window does not exist or already destroyed.")
+    refs.invalidate_root_cache()
 
     log_debug("Application cleanup finished.")
     delattr(on_close, 'stopping')
@@ -222,7 +224,7 @@ def launch_app():
             if root.winfo_exists():
                  root.after(0, hide_loading_and_update_controls)
 
-        threading.Thread(target=initial_model_load_task, daemon=True).start()
+        refs.submit_background(initial_model_load_task)
     else:
         log_debug("No default model selected or available for initial load.")
         print("Warning: No model loaded on startup. Please select a model from the UI.")
@@ -1,16 +1,116 @@
 import cv2
+import torch
+from torchvision.ops import batched_nms
+from ultralytics import RTDETR
 from app import config # Corrected
+from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug # Corrected
 
 log_debug("processing.frame_processor module initialized.") # Added log
 
+MAROON_COLOR = (48, 48, 176) # BGR
+WHITE_COLOR = (255, 255, 255)
+BLACK_COLOR = (0, 0, 0)
+TEXT_BG_PADDING = 5
+
+def _draw_detections(annotated_frame, boxes, class_indices, confidences, track_ids, current_class_list):
+    """Draw labelled boxes onto annotated_frame in place."""
+    for i in range(len(boxes)):
+        x1, y1, x2, y2 = map(int, boxes[i])
+        class_idx = class_indices[i]
+        conf = confidences[i]
+        
+        class_name = f"CLS_IDX_{class_idx}"
+        if current_class_list and isinstance(current_class_list, dict) and class_idx in current_class_list:
+            class_name = current_class_list[class_idx]
+        
+        label = f"{class_name} {conf:.2f}"
+        
+        if track_ids is not None and i < len(track_ids):
+            track_id_val = track_ids[i]
+            label = f"ID:{track_id_val} {label}"
+
+        cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), MAROON_COLOR, 2)
+        cv2.putText(annotated_frame, label, (x1, y1 - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, MAROON_COLOR, 2)
+
+def _draw_vehicle_count(annotated_frame, detected_vehicle_count_in_frame):
+    """Draw the 'Total Vehicles' banner onto annotated_frame in place."""
+    total_vehicles_text = f"Total Vehicles: {detected_vehicle_count_in_frame}"
+    text_origin = (50, 30)
+    font_face = cv2.FONT_HERSHEY_SIMPLEX
+    font_scale = 0.8
+    text_thickness = 2
+
+    (text_width, text_height), baseline = cv2.getTextSize(total_vehicles_text, font_face, font_scale, text_thickness)
+    
+    rect_x1 = text_origin[0] - TEXT_BG_PADDING
+    rect_y1 = text_origin[1] - text_height - TEXT_BG_PADDING - baseline # Adjusted for baseline
+    rect_x2 = text_origin[0] + text_width + TEXT_BG_PADDING
+    rect_y2 = text_origin[1] + TEXT_BG_PADDING # Adjusted for baseline
+
+    cv2.rectangle(annotated_frame, (rect_x1, rect_y1), (rect_x2, rect_y2), BLACK_COLOR, cv2.FILLED)
+    cv2.putText(annotated_frame, total_vehicles_text, text_origin,
+                font_face, font_scale, WHITE_COLOR, text_thickness)
+
+def predict_raw_detections(frame, current_model_obj):
+    """Run one permissive forward pass and return every candidate box as tensors on the model's device."""
+    with app_globals.inference_lock:
+        results = current_model_obj.predict(frame, conf=config.RAW_CANDIDATE_CONF, iou=config.RAW_CANDIDATE_IOU,
+                                            max_det=config.RAW_CANDIDATE_MAX_DET, verbose=False)
+    boxes = results[0].boxes
+    return {
+        'boxes': boxes.xyxy,
+        'scores': boxes.conf,
+        'classes': boxes.cls.long(),
+        'apply_nms': not isinstance(current_model_obj, RTDETR) # RT-DETR is NMS-free; predict() never runs NMS on it
+    }
+
+def reapply_thresholds(frame, raw_detections, current_class_list, active_filter_list=None,
+                       current_conf_thresh=0.25, current_iou_thresh=0.45, out=None):
+    """Annotate frame from cached candidates: confidence mask, class filter, class-aware NMS (not for RT-DETR), max_det cap, draw.
+
+    If out is an array of frame's shape and dtype, the annotation is drawn into it instead of a new copy.
+    """
+    if out is not None and out.shape == frame.shape and out.dtype == frame.dtype:
+        out[...] = frame
+        annotated_frame = out
+    else:
+        annotated_frame = frame.copy()
+    detected_vehicle_count_in_frame = 0
+
+    try:
+        boxes = raw_detections['boxes']
+        scores = raw_detections['scores']
+        classes = raw_detections['classes']
+
+        # Masking and class-aware NMS stay on the model's device; only the kept boxes are copied to the host.
+        keep_mask = scores > current_conf_thresh
+        if active_filter_list is not None:
+            keep_mask &= torch.isin(classes, torch.as_tensor(active_filter_list, device=classes.device))
+        boxes, scores, classes = boxes[keep_mask], scores[keep_mask], classes[keep_mask]
+
+        if boxes.shape[0] > 0:
+            if raw_detections.get('apply_nms', True):
+                kept = batched_nms(boxes, scores, classes, current_iou_thresh) # Sorted by descending score
+            else:
+                kept = torch.argsort(scores, descending=True)
+            kept = kept[:config.DETECTION_MAX_DET]
+            boxes, scores, classes = boxes[kept], scores[kept], classes[kept]
+
+        boxes, scores, classes = boxes.cpu().numpy(), scores.cpu().numpy(), classes.cpu().numpy()
+        detected_vehicle_count_in_frame = len(boxes)
+        _draw_detections(annotated_frame, boxes, classes, scores, None, current_class_list)
+        _draw_vehicle_count(annotated_frame, detected_vehicle_count_in_frame)
+    except Exception as e:
+        log_debug(f"Error in reapply_thresholds: {e}", exc_info=True)
+        cv2.putText(annotated_frame, "Processing Error", (50, 80),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+
+    return annotated_frame, detected_vehicle_count_in_frame
+
 def process_frame_yolo(frame_to_process, current_model_obj, current_class_list, persist_tracking=True, is_video_mode=False,
                          active_filter_list=None, current_conf_thresh=0.25, current_iou_thresh=0.45):
-    MAROON_COLOR = (48, 48, 176) # BGR
-    WHITE_COLOR = (255, 255, 255)
-    BLACK_COLOR = (0, 0, 0)
-    TEXT_BG_PADDING = 5
-
     if current_model_obj is None:
         # log_debug("process_frame_yolo: Active Model Not Loaded") # Avoid flooding logs
         cv2.putText(frame_to_process, "Active Model Not Loaded", (50, 50),
@@ -21,12 +121,14 @@ def process_frame_yolo(frame_to_process, current_model_obj, current_class_list,
     detected_vehicle_count_in_frame = 0
 
     try:
-        if is_video_mode:
-            results = current_model_obj.track(annotated_frame, persist=persist_tracking, classes=active_filter_list, 
-                                              conf=current_conf_thresh, iou=current_iou_thresh, verbose=False)
-        else:
-            results = current_model_obj.predict(annotated_frame, classes=active_filter_list, 
-                                                conf=current_conf_thresh, iou=current_iou_thresh, verbose=False)
+        # The model and its tracker are not thread-safe; seek display and playback can both get here.
+        with app_globals.inference_lock:
+            if is_video_mode:
+                results = current_model_obj.track(annotated_frame, persist=persist_tracking, classes=active_filter_list, 
+                                                  conf=current_conf_thresh, iou=current_iou_thresh, verbose=False)
+            else:
+                results = current_model_obj.predict(annotated_frame, classes=active_filter_list, 
+                                                    conf=current_conf_thresh, iou=current_iou_thresh, verbose=False)
 
         if results and results[0].boxes.data is not None and len(results[0].boxes.data) > 0:
             detected_vehicle_count_in_frame = len(results[0].boxes.data)
@@ -38,41 +140,9 @@ def process_frame_yolo(frame_to_process, current_model_obj, current_class_list,
             if is_video_mode and results[0].boxes.id is not None:
                 track_ids = results[0].boxes.id.cpu().numpy().astype(int)
 
-            for i in range(len(boxes)):
-                x1, y1, x2, y2 = map(int, boxes[i])
-                class_idx = class_indices[i]
-                conf = confidences[i]
-                
-                class_name = f"CLS_IDX_{class_idx}"
-                if current_class_list and isinstance(current_class_list, dict) and class_idx in current_class_list:
-                    class_name = current_class_list[class_idx]
+            _draw_detections(annotated_frame, boxes, class_indices, confidences, track_ids, current_class_list)
                 
-                label = f"{class_name} {conf:.2f}"
-                
-                if track_ids is not None and i < len(track_ids):
-                    track_id_val = track_ids[i]
-                    label = f"ID:{track_id_val} {label}"
-
-                cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), MAROON_COLOR, 2)
-                cv2.putText(annotated_frame, label, (x1, y1 - 10),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, MAROON_COLOR, 2)
-                
-        total_vehicles_text = f"Total Vehicles: {detected_vehicle_count_in_frame}"
-        text_origin = (50, 30)
-        font_face = cv2.FONT_HERSHEY_SIMPLEX
-        font_scale = 0.8
-        text_thickness = 2
-
-        (text_width, text_height), baseline = cv2.getTextSize(total_vehicles_text, font_face, font_scale, text_thickness)
-        
-        rect_x1 = text_origin[0] - TEXT_BG_PADDING
-        rect_y1 = text_origin[1] - text_height - TEXT_BG_PADDING - baseline # Adjusted for baseline
-        rect_x2 = text_origin[0] + text_width + TEXT_BG_PADDING
-        rect_y2 = text_origin[1] + TEXT_BG_PADDING # Adjusted for baseline
-
-        cv2.rectangle(annotated_frame, (rect_x1, rect_y1), (rect_x2, rect_y2), BLACK_COLOR, cv2.FILLED)
-        cv2.putText(annotated_frame, total_vehicles_text, text_origin,
-                    font_face, font_scale, WHITE_COLOR, text_thickness)
+        _draw_vehicle_count(annotated_frame, detected_vehicle_count_in_frame)
     except Exception as e:
         log_debug(f"Error in process_frame_yolo: {e}", exc_info=True)
         cv2.putText(annotated_frame, "Processing Error", (50, 80),
@@ -1,5 +1,6 @@
 import torch
 import os
+import numpy as np
 from ultralytics import YOLO, RTDETR 
 from app import config
 from app.core import globals as app_globals
@@ -30,6 +31,80 @@ def is_custom_model_selected():
     """Check if a custom model is currently selected."""
     return app_globals.active_model_key == "Select Custom Model"
 
+def _activate_cached_model(cache_key):
+    """Make a previously loaded model active again. Returns False on a cache miss."""
+    cached = app_globals.model_cache.get(cache_key)
+    if cached is None:
+        return False
+    app_globals.model_cache.move_to_end(cache_key)
+
+    model_key = cache_key[0]
+    _reset_tracker(cached['model'])
+    app_globals.active_model_object_global = cached['model']
+    app_globals.active_class_list_global = cached['class_list']
+    app_globals.device_to_use = cached['device']
+    app_globals.active_model_key = model_key
+    AVAILABLE_MODELS[model_key]['instance'] = cached['model']
+    AVAILABLE_MODELS[model_key]['class_list'] = cached['class_list']
+    _update_processed_class_filter()
+
+    log_debug(f"Model '{model_key}' reactivated from cache on {cached['device']}.")
+    print(f"Model '{model_key}' reactivated from cache.") # To standard console
+    return True
+
+def _reset_tracker(model):
+    """Forget track(persist=True) state so a reused model starts the next video with fresh track IDs."""
+    predictor = getattr(model, 'predictor', None)
+    with app_globals.inference_lock:
+        for tracker in getattr(predictor, 'trackers', None) or []:
+            tracker.reset()
+
+def _warmup_model(model):
+    """Run one blank inference so the first real frame does not pay for predictor setup and kernel selection."""
+    try:
+        size = config.MODEL_WARMUP_IMAGE_SIZE
+        model.predict(np.zeros((size, size, 3), dtype=np.uint8), verbose=False)
+    except Exception as e:
+        log_debug(f"Model warmup failed (continuing without it): {e}", exc_info=True)
+
+def _cache_loaded_model(cache_key):
+    """Warm up the active model, store it in the LRU cache and evict the least recently used entry."""
+    _warmup_model(app_globals.active_model_object_global)
+    app_globals.model_cache[cache_key] = {
+        'model': app_globals.active_model_object_global,
+        'class_list': app_globals.active_class_list_global,
+        'device': app_globals.device_to_use
+    }
+    app_globals.model_cache.move_to_end(cache_key)
+
+    while len(app_globals.model_cache) > config.MODEL_CACHE_SIZE:
+        (evicted_key, _), evicted = app_globals.model_cache.popitem(last=False)
+        if AVAILABLE_MODELS.get(evicted_key, {}).get('instance') is evicted['model']:
+            AVAILABLE_MODELS[evicted_key]['instance'] = None
+            AVAILABLE_MODELS[evicted_key]['class_list'] = {}
+        log_debug(f"Evicted model '{evicted_key}' from cache.")
+        del evicted
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+def activate_cached_model(model_key):
+    """Activate a model straight from the cache without touching disk. Returns False on a miss."""
+    model_config = AVAILABLE_MODELS.get(model_key)
+    if model_config is None:
+        return False
+    return _activate_cached_model((model_key, model_config['path']))
+
+def evict_cached_model(model_key):
+    """Drop every cached entry for model_key (e.g. before its weights file is re-selected) and free GPU memory."""
+    for cache_key in [key for key in app_globals.model_cache if key[0] == model_key]:
+        cached = app_globals.model_cache.pop(cache_key)
+        if AVAILABLE_MODELS.get(model_key, {}).get('instance') is cached['model'] and cached['model'] is not app_globals.active_model_object_global:
+            AVAILABLE_MODELS[model_key]['instance'] = None
+            AVAILABLE_MODELS[model_key]['class_list'] = {}
+        log_debug(f"Evicted model '{model_key}' ({cache_key[1]}) from cache.")
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
 def _update_processed_class_filter():
     log_debug("Updating processed class filter.")
     valid_classes = []
@@ -93,6 +168,11 @@ def load_model(model_key_to_load):
 
         model_config = AVAILABLE_MODELS[model_key_to_load]
         log_debug(f"Model config for {model_key_to_load}: {model_config['path']}")
+
+        cache_key = (model_key_to_load, model_config['path'])
+        if _activate_cached_model(cache_key):
+            load_successful = True
+            return True
         # print(f"Attempting to load model: {model_key_to_load} ({model_config['path']})") # To standard console
 
         model_path_from_config = model_config['path']
@@ -213,6 +293,7 @@ def load_model(model_key_to_load):
         model_config['class_list'] = app_globals.active_class_list_global
         
         _update_processed_class_filter()
+        _cache_loaded_model(cache_key)
         
         actual_device_str = str(getattr(app_globals.active_model_object_global.device, 'type', "Unknown"))
         log_debug(f"Model '{model_key_to_load}' loaded. Classes: {len(app_globals.active_class_list_global)}. Configured to run on: {actual_device_str}.")
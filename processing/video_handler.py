@@ -1,21 +1,39 @@
 import cv2
+import functools
 import os
+import queue
+import shutil
+import subprocess
 import tempfile
 import threading
 import time
+from app import config
 from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
 from .frame_processor import process_frame_yolo
 
+try:
+    import av # Optional: keyframe-accurate seeks without decoding up to the target
+except ImportError:
+    av = None
+
 log_debug("processing.video_handler module initialized.")
 
 def format_time_display(current_seconds, total_seconds):
-    def to_mm_ss(seconds):
-        seconds = max(0, float(seconds))
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes:02d}:{secs:02d}"
-    return f"{to_mm_ss(current_seconds)} / {to_mm_ss(total_seconds)}"
+    # Labels only show whole seconds, so slider drags and playback ticks mostly hit the cache
+    return _format_whole_seconds_display(max(0, int(current_seconds)), max(0, int(total_seconds)))
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_seconds_display(current_seconds, total_seconds):
+    return f"{_format_whole_seconds(current_seconds)} / {_format_whole_seconds(total_seconds)}"
+
+def format_single_time(seconds):
+    """Format one timestamp as MM:SS (the halves of format_time_display)."""
+    return _format_whole_seconds(max(0, int(seconds)))
+
+def _format_whole_seconds(seconds):
+    minutes, secs = divmod(seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"
 
 def format_seconds_to_hhmmss(seconds):
     """Formats seconds into HH:MM:SS string."""
@@ -25,8 +43,338 @@ def format_seconds_to_hhmmss(seconds):
     secs = seconds % 60
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
+def publish_video_meta(fps, total_frames, **extra_meta):
+    """Rebind the immutable video meta snapshot and mirror it into current_video_meta."""
+    duration_s = total_frames / fps if fps > 0 else 0
+    app_globals.video_meta_snapshot = app_globals.VideoMeta(fps, total_frames, duration_s)
+    app_globals.current_video_meta.update({
+        'fps': fps,
+        'total_frames': total_frames,
+        'duration_seconds': duration_s,
+        **extra_meta
+    })
+
+def clear_video_meta():
+    """Reset both the meta snapshot and the current_video_meta dict."""
+    app_globals.video_meta_snapshot = app_globals.VideoMeta(0.0, 0, 0.0)
+    app_globals.current_video_meta.clear()
+
+def _open_hw_accelerated_capture(file_path):
+    """Open file_path on FFMPEG with hardware decoding, or return None to fall back to software decode."""
+    if not config.VIDEO_HW_DECODE or not hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+        return None # Disabled, or OpenCV < 4.5.2
+    try:
+        cap = cv2.VideoCapture(file_path, cv2.CAP_FFMPEG, [
+            cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY,
+            cv2.CAP_PROP_HW_DEVICE, config.VIDEO_HW_DEVICE,
+        ])
+    except cv2.error as e:
+        log_debug(f"Hardware-accelerated open failed for {file_path}: {e}")
+        return None
+    if not cap.isOpened():
+        cap.release()
+        return None
+    if int(cap.get(cv2.CAP_PROP_HW_ACCELERATION)) == cv2.VIDEO_ACCELERATION_NONE:
+        log_debug(f"No hardware decoder available for {file_path}; using software decode.")
+    return cap
+
+def open_video_capture(file_path):
+    """Open a VideoCapture, preferring the FFMPEG backend. Returns None if the file cannot be opened."""
+    cap = _open_hw_accelerated_capture(file_path)
+    if cap is None:
+        cap = cv2.VideoCapture(file_path, cv2.CAP_FFMPEG)
+    if not cap.isOpened():
+        log_debug(f"FFMPEG backend could not open {file_path}; retrying with default backend.")
+        cap.release()
+        cap = cv2.VideoCapture(file_path)
+    if not cap.isOpened():
+        cap.release()
+        return None
+    # Frames are buffered by the read-ahead decoder (frame_queue); the backend needs no extra queue.
+    # Backends without a buffer-size property ignore this.
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    try:
+        log_debug(f"Opened {file_path} with the {cap.getBackendName()} backend.")
+    except cv2.error:
+        log_debug(f"Opened {file_path}; backend name unavailable.")
+    return cap
+
+def read_capture_info(cap):
+    """Read fps, frame count and frame size from an open capture in one place."""
+    return app_globals.CaptureInfo(
+        cap.get(cv2.CAP_PROP_FPS),
+        int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+        int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    )
+
+def get_capture_info(file_path, cap):
+    """Return the container properties for a cached capture, querying the backend only on first use."""
+    info = app_globals.capture_info_cache.get(file_path)
+    if info is None:
+        info = read_capture_info(cap)
+        app_globals.capture_info_cache[file_path] = info
+    return info
+
+def get_cached_capture(file_path):
+    """Return an open VideoCapture for file_path, reusing the cached handle. Call with video_access_lock held."""
+    cap = app_globals.video_capture_cache.get(file_path)
+    if cap is not None and cap.isOpened():
+        return cap
+
+    app_globals.capture_info_cache.pop(file_path, None)
+    cap = open_video_capture(file_path)
+    if cap is None:
+        app_globals.video_capture_cache.pop(file_path, None)
+        return None
+    # Sanity probe: make sure at least one frame can be demuxed, then rewind.
+    if not cap.grab():
+        log_debug(f"Capture for {file_path} opened but no frame could be grabbed.")
+        cap.release()
+        app_globals.video_capture_cache.pop(file_path, None)
+        return None
+    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+    app_globals.video_capture_cache[file_path] = cap
+    app_globals.capture_info_cache[file_path] = read_capture_info(cap)
+    log_debug(f"Opened and cached video capture for {file_path}")
+    return cap
+
+def invalidate_decoded_frames():
+    """Mark read-ahead frames stale after the capture moves. Call with video_access_lock held."""
+    app_globals.decode_generation += 1
+    app_globals.decoder_skip_frames = 0
+    while True:
+        try:
+            app_globals.frame_queue.get_nowait()
+        except queue.Empty:
+            break
+
+def rewind_capture(cap, frame_number=0):
+    """Set cap's position and invalidate read-ahead frames. Call with video_access_lock held."""
+    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+    invalidate_decoded_frames()
+
+def _frame_decoder_thread_func(generation):
+    """Decode frames from the current capture into frame_queue until the generation changes."""
+    frame_queue = app_globals.frame_queue
+    while not app_globals.stop_video_processing_flag.is_set():
+        with app_globals.video_access_lock:
+            if generation != app_globals.decode_generation:
+                return
+            cap = app_globals.video_capture_global
+            if cap is None or not cap.isOpened():
+                return
+            skip_frames, app_globals.decoder_skip_frames = app_globals.decoder_skip_frames, 0
+            skip_frames += app_globals.frame_skip_stride - 1
+            for _ in range(skip_frames):
+                if not cap.grab():
+                    break
+            ret, frame = cap.read()
+            frame_number = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+
+        item = (generation, frame_number, frame if ret else None) # frame None marks end of stream
+        while generation == app_globals.decode_generation:
+            try:
+                frame_queue.put(item, timeout=0.1) # Blocks while the queue is full: natural backpressure
+                break
+            except queue.Full:
+                if app_globals.stop_video_processing_flag.is_set():
+                    return
+        if not ret:
+            return
+
+def ensure_frame_decoder():
+    """Start a read-ahead decoder for the current generation unless one is already running."""
+    if (app_globals.decoder_thread is not None and app_globals.decoder_thread.is_alive()
+            and app_globals.decoder_thread_generation == app_globals.decode_generation):
+        return
+    generation = app_globals.decode_generation
+    app_globals.decoder_thread_generation = generation
+    app_globals.decoder_thread = threading.Thread(target=_frame_decoder_thread_func, args=(generation,), daemon=True)
+    app_globals.decoder_thread.start()
+
+def seek_capture(cap, target_frame, cancel_event=None):
+    """Position cap so its next read returns target_frame. Returns False if cancelled or past the end."""
+    cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
+    invalidate_decoded_frames()
+    # Some backends land on the preceding keyframe; walk forward with grab(),
+    # which demuxes/decodes without the colour conversion and copy of retrieve().
+    delta = target_frame - int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+    for _ in range(max(0, delta)):
+        if cancel_event is not None and cancel_event.is_set():
+            return False
+        if not cap.grab():
+            return False
+    return True
+
+def seek_and_read(cap, target_frame, cancel_event=None):
+    """Position cap on target_frame and decode only that frame. Returns (ret, frame)."""
+    if not seek_capture(cap, target_frame, cancel_event):
+        return False, None
+    if not cap.grab():
+        return False, None
+    return cap.retrieve()
+
+def _get_av_container(file_path):
+    """Return a cached PyAV container for file_path. Call with video_access_lock held."""
+    container = app_globals.av_container_cache.get(file_path)
+    if container is None:
+        container = av.open(file_path)
+        container.streams.video[0].thread_type = 'AUTO'
+        app_globals.av_container_cache[file_path] = container
+    return container
+
+def av_seek_and_read(file_path, target_frame, total_frames, exact=False, cancel_event=None):
+    """Decode target_frame with PyAV, or with exact=False the keyframe at or before it. Returns (ret, frame).
+
+    Call with video_access_lock held. Returns (False, None) if PyAV is unavailable or the seek fails.
+    """
+    if av is None or not file_path:
+        return False, None
+    try:
+        container = _get_av_container(file_path)
+        stream = container.streams.video[0]
+        start_pts = stream.start_time or 0
+        if stream.duration and total_frames > 0:
+            target_pts = start_pts + int(target_frame * stream.duration / total_frames)
+        else:
+            target_pts = start_pts + int(target_frame / float(stream.average_rate) / stream.time_base)
+
+        container.seek(target_pts, stream=stream, any_frame=False, backward=True)
+        stream.codec_context.flush_buffers() # Drop frames buffered from before the seek
+        for frame in container.decode(stream):
+            if cancel_event is not None and cancel_event.is_set():
+                return False, None
+            if not exact or frame.pts is None or frame.pts >= target_pts:
+                return True, frame.to_ndarray(format='bgr24')
+    except Exception as e:
+        log_debug(f"PyAV seek to frame {target_frame} failed for {file_path}: {e}", exc_info=True)
+        stale_container = app_globals.av_container_cache.pop(file_path, None)
+        if stale_container is not None:
+            stale_container.close()
+    return False, None
+
+def get_preview_path():
+    """Return the scrubbing preview for the current upload, or None if it is not ready."""
+    preview_path = app_globals.preview_video_path
+    if preview_path and app_globals.preview_source_path == app_globals.current_uploaded_file_path_global:
+        return preview_path
+    return None
+
+def start_preview_transcode(video_file_path, duration_seconds):
+    """Transcode video_file_path to an all-keyframe MJPEG preview in the background for fast scrubbing."""
+    if duration_seconds > config.PREVIEW_MAX_DURATION_S:
+        log_debug(f"Skipping scrubbing preview for {video_file_path}: {duration_seconds:.0f}s exceeds {config.PREVIEW_MAX_DURATION_S}s.")
+        return
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        log_debug("ffmpeg not found on PATH; slider scrubbing will seek the original video.")
+        return
+    threading.Thread(target=_preview_transcode_thread_func, args=(ffmpeg_path, video_file_path), daemon=True).start()
+
+def _preview_transcode_thread_func(ffmpeg_path, video_file_path):
+    """Run ffmpeg and publish the preview if the same video is still loaded."""
+    fd, preview_path = tempfile.mkstemp(suffix='.avi')
+    os.close(fd)
+    threads = str(config.PREVIEW_FFMPEG_THREADS)
+    command = [
+        ffmpeg_path, '-y', '-loglevel', 'error', '-threads', threads, '-i', video_file_path,
+        '-an', '-vsync', 'passthrough', # Keep a 1:1 frame mapping with the original
+        '-c:v', 'mjpeg', '-q:v', str(config.PREVIEW_MJPEG_QUALITY), '-threads', threads,
+        '-vf', f"scale=-2:'min({config.PREVIEW_HEIGHT},ih)'",
+        preview_path
+    ]
+    log_debug(f"Starting scrubbing preview transcode: {' '.join(command)}")
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                   creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))
+    except OSError as e:
+        log_debug(f"Scrubbing preview transcode failed to start for {video_file_path}: {e}")
+        _unlink_quietly(preview_path)
+        return
+    cancel_preview_transcode() # At most one transcode runs at a time
+    app_globals.preview_transcode_process = process
+    if app_globals.current_uploaded_file_path_global != video_file_path:
+        cancel_preview_transcode() # A newer upload's cleanup ran before this process was published
+    return_code = process.wait()
+    if app_globals.preview_transcode_process is process:
+        app_globals.preview_transcode_process = None
+    if return_code != 0:
+        log_debug(f"Scrubbing preview transcode for {video_file_path} failed or was cancelled (exit code {return_code}).")
+        _unlink_quietly(preview_path)
+        return
+
+    if app_globals.current_uploaded_file_path_global != video_file_path:
+        log_debug(f"Discarding scrubbing preview for {video_file_path}; a different file is loaded now.")
+        _unlink_quietly(preview_path)
+        return
+    _delete_preview_video_file()
+    app_globals.preview_source_path = video_file_path
+    app_globals.preview_video_path = preview_path
+    log_debug(f"Scrubbing preview ready: {preview_path}")
+
+def _unlink_quietly(file_path):
+    try:
+        os.unlink(file_path)
+    except OSError:
+        pass
+
+def cancel_preview_transcode():
+    """Kill the running preview transcode, if any; its thread then deletes the partial file."""
+    process = app_globals.preview_transcode_process
+    app_globals.preview_transcode_process = None
+    if process is not None and process.poll() is None:
+        log_debug("Cancelling scrubbing preview transcode.")
+        process.kill()
+
+def _cleanup_preview_video_file():
+    """Stop any preview transcode and delete the current scrubbing preview."""
+    cancel_preview_transcode()
+    _delete_preview_video_file()
+
+def _delete_preview_video_file():
+    """Delete the scrubbing preview transcode, releasing its cached capture first."""
+    preview_path = app_globals.preview_video_path
+    app_globals.preview_video_path = None
+    app_globals.preview_source_path = None
+    if not preview_path:
+        return
+    with app_globals.video_access_lock:
+        if preview_path in app_globals.video_capture_cache:
+            evict_cached_captures(set(app_globals.video_capture_cache) - {preview_path})
+    _unlink_quietly(preview_path)
+    log_debug(f"Deleted scrubbing preview: {preview_path}")
+
+def is_cached_capture(cap):
+    """Check whether cap is owned by the capture cache."""
+    return any(cached is cap for cached in app_globals.video_capture_cache.values())
+
+def release_capture(cap):
+    """Release cap unless it is owned by the capture cache."""
+    if cap is not None and not is_cached_capture(cap):
+        cap.release()
+
+def evict_cached_captures(keep_paths=()):
+    """Release cached captures whose path is not in keep_paths. Call with video_access_lock held."""
+    for path in list(app_globals.video_capture_cache):
+        if path in keep_paths:
+            continue
+        cap = app_globals.video_capture_cache.pop(path)
+        app_globals.capture_info_cache.pop(path, None)
+        if app_globals.video_capture_global is cap:
+            app_globals.video_capture_global = None
+        cap.release()
+        log_debug(f"Evicted cached video capture for {path}")
+    for path in list(app_globals.av_container_cache):
+        if path not in keep_paths:
+            app_globals.av_container_cache.pop(path).close()
+
 def _cleanup_processed_video_temp_file():
     log_debug(f"Attempting to cleanup temp file: {app_globals.processed_video_temp_file_path_global}")
+    if app_globals.processed_video_temp_file_path_global in app_globals.video_capture_cache:
+        with app_globals.video_access_lock:
+            keep_paths = set(app_globals.video_capture_cache) - {app_globals.processed_video_temp_file_path_global}
+            evict_cached_captures(keep_paths)
     if app_globals.processed_video_temp_file_path_global and os.path.exists(app_globals.processed_video_temp_file_path_global):
         try:
             os.unlink(app_globals.processed_video_temp_file_path_global)
@@ -35,9 +383,21 @@ def _cleanup_processed_video_temp_file():
         except OSError as e_unlink:
             log_debug(f"Error deleting temp file {app_globals.processed_video_temp_file_path_global}: {e_unlink}", exc_info=True)
             print(f"Warning: Could not delete temporary processed video {app_globals.processed_video_temp_file_path_global}: {e_unlink}")
+    app_globals.processed_video_ready_event.clear()
     app_globals.processed_video_temp_file_path_global = None
 
 
+def _fsync_file(file_path):
+    """Flush a finished file to disk so a reader opening it next sees the complete container."""
+    try:
+        fd = os.open(file_path, os.O_RDWR) # O_RDWR: fsync on a read-only handle fails on Windows
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        log_debug(f"fsync failed for {file_path}: {e}")
+
 def fast_video_processing_thread_func(video_file_path, progress_callback=None):
     """Thread function for batch processing a video and saving it to a temporary file. """
     log_debug(f"Fast video processing thread STARTS for {video_file_path}")
@@ -50,16 +410,13 @@ def fast_video_processing_thread_func(video_file_path, progress_callback=None):
     processing_fps_estimate = 0
 
     try:
-        cap = cv2.VideoCapture(video_file_path)
-        if not cap.isOpened():
+        cap = open_video_capture(video_file_path)
+        if cap is None:
             log_debug(f"Error: Cannot open video file {video_file_path}")
             if progress_callback: progress_callback(1.0, "Error") # Signal completion with error
             return
 
-        source_fps = cap.get(cv2.CAP_PROP_FPS)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        source_fps, total_frames, width, height = read_capture_info(cap)
 
         log_debug(f"Video properties: {source_fps} FPS, {total_frames} frames, {width}x{height}")
 
@@ -83,7 +440,6 @@ def fast_video_processing_thread_func(video_file_path, progress_callback=None):
             return
 
         frame_count = 0
-        last_progress_update_time = time.time()
 
         while not app_globals.stop_fast_processing_flag.is_set():
             ret, frame = cap.read()
@@ -110,7 +466,8 @@ def fast_video_processing_thread_func(video_file_path, progress_callback=None):
             frames_processed_since_last_rate_calc +=1
             current_time = time.time()
 
-            if (current_time - last_progress_update_time >= 0.25 or frame_count == total_frames) and progress_callback:
+            # Reported every frame: update_fast_progress coalesces to one UI refresh per PLAYBACK_UI_UPDATE_INTERVAL_MS.
+            if progress_callback:
                 progress = frame_count / total_frames if total_frames > 0 else 0
                 
                 # Calculate processing FPS and estimated time remaining
@@ -126,24 +483,23 @@ def fast_video_processing_thread_func(video_file_path, progress_callback=None):
                     seconds_left = frames_remaining / processing_fps_estimate
                     time_left_str = format_seconds_to_hhmmss(seconds_left)
                 
-                log_debug(f"Fast process: Calling progress_callback with {progress*100:.1f}% ({frame_count}/{total_frames}), Time Left: {time_left_str}")
                 progress_callback(progress, time_left_str)
-                last_progress_update_time = current_time
 
         cap.release()
         out.release()
-        log_debug(f"Fast process: VideoWriter released for {temp_output_path_local}")
-
-        time.sleep(0.1)
+        _fsync_file(temp_output_path_local)
+        log_debug(f"Fast process: VideoWriter released and synced for {temp_output_path_local}")
 
         if not app_globals.stop_fast_processing_flag.is_set():
             log_debug(f"Fast processing successfully completed. Processed video saved to {temp_output_path_local}")
             app_globals.processed_video_temp_file_path_global = temp_output_path_local
+            app_globals.processed_video_ready_event.set()
             success = True
             if progress_callback: progress_callback(1.0, "00:00:00") # Final update
         else:
             log_debug("Fast processing was stopped by user flag.")
             if temp_output_path_local and os.path.exists(temp_output_path_local): os.unlink(temp_output_path_local)
+            app_globals.processed_video_ready_event.clear()
             app_globals.processed_video_temp_file_path_global = None
             if progress_callback: progress_callback(1.0, "Cancelled") # Final update
 
@@ -152,6 +508,7 @@ def fast_video_processing_thread_func(video_file_path, progress_callback=None):
         if temp_output_path_local and os.path.exists(temp_output_path_local):
             try: os.unlink(temp_output_path_local)
             except OSError: pass
+        app_globals.processed_video_ready_event.clear()
         app_globals.processed_video_temp_file_path_global = None
         if progress_callback: progress_callback(1.0, "Error") # Signal completion with error
     finally:
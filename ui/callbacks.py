@@ -12,7 +12,7 @@ from .handlers import loading_manager
 from .handlers import seek_optimizer
 from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
-from app.processing.video_handler import _cleanup_processed_video_temp_file
+from app.processing.video_handler import _cleanup_processed_video_temp_file, release_capture, invalidate_decoded_frames
 
 log_debug("ui.callbacks module initialized.")
 
@@ -22,6 +22,7 @@ def _stop_all_processing_logic():
     root = refs.get_root() 
     
     app_globals.stop_video_processing_flag.set() 
+    app_globals.playback_start_token += 1 # Drop any capture open still in flight
 
     if app_globals.is_playing_via_after_loop and app_globals.after_id_playback_loop: 
         if root and root.winfo_exists():
@@ -40,7 +41,8 @@ def _stop_all_processing_logic():
             log_debug("Legacy video_thread did not join in time.")
         app_globals.video_thread = None
     
-    app_globals.video_paused_flag.clear() 
+    app_globals.video_paused = False 
+    app_globals.frame_skip_stride = 1 # A stride from this session must not carry into the next playback
 
     if app_globals.fast_video_processing_thread and app_globals.fast_video_processing_thread.is_alive():
         app_globals.stop_fast_processing_flag.set()
@@ -69,9 +71,11 @@ def _stop_all_processing_logic():
 
     with app_globals.video_access_lock:
         if app_globals.video_capture_global and app_globals.video_capture_global.isOpened():
-            log_debug("Releasing video capture object.")
-            app_globals.video_capture_global.release()
+            # Cached captures stay open so the next Play/Process can reuse them without re-probing the container.
+            log_debug("Releasing video capture object (cached handles are kept open).")
+            release_capture(app_globals.video_capture_global)
         app_globals.video_capture_global = None 
+        invalidate_decoded_frames() # Retires the read-ahead decoder and drops its queued frames
     
     if app_globals.slider_debounce_timer and root and root.winfo_exists():
         try:
@@ -113,6 +117,7 @@ def init_callbacks(root_win, components_dict):
     if progress_slider_widget:
         progress_slider_widget.bind("<Button-1>", event_handlers.handle_slider_click_press)
         progress_slider_widget.bind("<ButtonRelease-1>", event_handlers.handle_slider_click_release)
+        progress_slider_widget.bind("<Configure>", lambda e: setattr(app_globals, 'progress_slider_width', e.width), add="+")
     
     # Removed stdout/stderr redirection as console output box is removed
     # sys.stdout = RedirectText(components_dict["output_text"])
@@ -10,6 +10,11 @@ import math
 from app import config
 from app.utils.logger_setup import log_debug
 
+try:
+    import av # Optional: libswscale does colour conversion and resize in one pass
+except ImportError:
+    av = None
+
 log_debug("ui.custom_widgets module initialized.")
 
 class LoadingOverlay(tk.Toplevel):
@@ -123,6 +128,44 @@ class LoadingOverlay(tk.Toplevel):
         if self.winfo_exists(): self.grab_release()
         super().destroy()
 
+class ToastNotification(tk.Toplevel):
+    """Non-blocking notification shown at the bottom-right of the parent window."""
+    LEVEL_COLORS = {
+        "info": config.COLOR_INFO,
+        "warning": config.COLOR_WARNING,
+        "error": config.COLOR_ERROR,
+    }
+
+    def __init__(self, parent_window, title, message, level="info", duration_ms=config.TOAST_DURATION_MS):
+        super().__init__(parent_window)
+        self.dismiss_job_id = None
+        self.overrideredirect(True)
+        self.configure(bg=self.LEVEL_COLORS.get(level, config.COLOR_INFO))
+
+        body = tk.Frame(self, bg=config.COLOR_SURFACE, padx=config.SPACING_MEDIUM, pady=config.SPACING_SMALL)
+        body.pack(padx=(4, 0), fill="both", expand=True)
+        tk.Label(body, text=title, font=config.FONT_BUTTON, bg=config.COLOR_SURFACE,
+                 fg=config.COLOR_TEXT_PRIMARY, anchor="w").pack(fill="x")
+        tk.Label(body, text=message, font=config.FONT_CAPTION, bg=config.COLOR_SURFACE,
+                 fg=config.COLOR_TEXT_SECONDARY, anchor="w", justify="left",
+                 wraplength=config.TOAST_WRAP_LENGTH).pack(fill="x")
+
+        self.update_idletasks()
+        x = parent_window.winfo_rootx() + parent_window.winfo_width() - self.winfo_reqwidth() - config.SPACING_MEDIUM
+        y = parent_window.winfo_rooty() + parent_window.winfo_height() - self.winfo_reqheight() - config.SPACING_MEDIUM
+        self.geometry(f"+{max(0, x)}+{max(0, y)}")
+        self.lift()
+
+        self.bind("<Button-1>", lambda event: self.destroy())
+        self.dismiss_job_id = self.after(duration_ms, self.destroy)
+
+    def destroy(self):
+        if self.dismiss_job_id:
+            try: self.after_cancel(self.dismiss_job_id)
+            except tk.TclError: pass
+            self.dismiss_job_id = None
+        super().destroy()
+
 class VideoDisplayFrame(ttk.Frame):
     """Frame for displaying video frames, adapting to available space."""
     def __init__(self, parent, initial_width=640, initial_height=480, **kwargs):
@@ -131,6 +174,9 @@ class VideoDisplayFrame(ttk.Frame):
         self.display_label.pack(expand=True, fill="both")
         self.current_photo_image = None
         self.last_displayed_frame_raw = None 
+        self._tk_img = None # Reused PhotoImage for streamed frames; repainted with paste()
+        self._tk_img_size = (0, 0)
+        self._rgb_scratch = None # Reused cvtColor output for the OpenCV/PIL fallback path
         self.target_width = initial_width
         self.target_height = initial_height
         self._update_empty_display()
@@ -153,20 +199,10 @@ class VideoDisplayFrame(ttk.Frame):
         self.current_photo_image = ImageTk.PhotoImage(empty_pil_image)
         self.display_label.config(image=self.current_photo_image)
         self.last_displayed_frame_raw = None
+        self._tk_img_size = (0, 0)
 
-    def _display_cv2_frame(self, cv2_frame_bgr):
-        if cv2_frame_bgr is None:
-            self._update_empty_display()
-            return
-
-        frame_rgb = cv2.cvtColor(cv2_frame_bgr, cv2.COLOR_BGR2RGB)
-        pil_image_original = Image.fromarray(frame_rgb)
-        
-        original_width, original_height = pil_image_original.size
-        if original_width == 0 or original_height == 0: 
-            self._update_empty_display()
-            return
-
+    def _fit_size(self, original_width, original_height):
+        """Return the aspect-preserving size that fits the current display area."""
         aspect_ratio = original_width / original_height
         
         new_width = self.target_width
@@ -176,16 +212,67 @@ class VideoDisplayFrame(ttk.Frame):
             new_height = self.target_height
             new_width = int(new_height * aspect_ratio)
         
-        new_width = max(1, new_width) 
-        new_height = max(1, new_height)
+        return max(1, new_width), max(1, new_height)
 
-        resized_pil_image = pil_image_original.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-        self.current_photo_image = ImageTk.PhotoImage(resized_pil_image)
+    def _fitted_pil_image(self, cv2_frame_bgr):
+        """Convert a BGR frame to an RGB PIL image fitted to the display, or None."""
+        if cv2_frame_bgr is None:
+            return None
+        original_height, original_width = cv2_frame_bgr.shape[:2]
+        if original_width == 0 or original_height == 0:
+            return None
+
+        fitted_size = self._fit_size(original_width, original_height)
+        if av is not None:
+            try:
+                video_frame = av.VideoFrame.from_ndarray(cv2_frame_bgr, format='bgr24')
+                return video_frame.reformat(width=fitted_size[0], height=fitted_size[1], format='rgb24').to_image()
+            except Exception as e:
+                log_debug(f"PyAV reformat failed, falling back to OpenCV/PIL: {e}")
+
+        scratch = self._rgb_scratch if self._rgb_scratch is not None and self._rgb_scratch.shape == cv2_frame_bgr.shape else None
+        frame_rgb = self._rgb_scratch = cv2.cvtColor(cv2_frame_bgr, cv2.COLOR_BGR2RGB, dst=scratch)
+        # frombuffer wraps the contiguous cvtColor output without the extra copy fromarray makes;
+        # resize() always returns a new image, so the scratch buffer can be overwritten next frame.
+        pil_image_original = Image.frombuffer('RGB', (original_width, original_height), frame_rgb, 'raw', 'RGB', 0, 1)
+        return pil_image_original.resize(fitted_size, Image.Resampling.LANCZOS)
+
+    def render_photo(self, cv2_frame_bgr):
+        """Build a standalone PhotoImage fitted to the display without showing it."""
+        pil_image = self._fitted_pil_image(cv2_frame_bgr)
+        return ImageTk.PhotoImage(pil_image) if pil_image is not None else None
+
+    def _display_cv2_frame(self, cv2_frame_bgr):
+        pil_image = self._fitted_pil_image(cv2_frame_bgr)
+        if pil_image is None:
+            self._update_empty_display()
+            return
+
+        if pil_image.size != self._tk_img_size or self._tk_img is None:
+            self._tk_img = ImageTk.PhotoImage(image=pil_image)
+            self._tk_img_size = pil_image.size
+        else:
+            self._tk_img.paste(pil_image)
+
+        if self.current_photo_image is not self._tk_img:
+            self.current_photo_image = self._tk_img
+            self.display_label.config(image=self.current_photo_image)
+
+    def blit_cached(self, photo_image, source_frame_bgr):
+        """Show a pre-rendered PhotoImage. Returns False if it no longer fits the display."""
+        if photo_image is None or source_frame_bgr is None:
+            return False
+        original_height, original_width = source_frame_bgr.shape[:2]
+        if (photo_image.width(), photo_image.height()) != self._fit_size(original_width, original_height):
+            return False
+        self.last_displayed_frame_raw = source_frame_bgr
+        self.current_photo_image = photo_image # _tk_img stays untouched so the cached photo is never pasted over
         self.display_label.config(image=self.current_photo_image)
+        return True
 
     def update_frame(self, new_cv2_frame_bgr):
-        self.last_displayed_frame_raw = new_cv2_frame_bgr.copy() if new_cv2_frame_bgr is not None else None
+        # Kept by reference for resize redraws; callers hand over freshly decoded/annotated frames and never mutate them.
+        self.last_displayed_frame_raw = new_cv2_frame_bgr
         self._display_cv2_frame(self.last_displayed_frame_raw)
     
     def clear(self):
@@ -6,7 +6,9 @@ This module maintains backward compatibility while using the new modular structu
 from . import video_async
 from . import file_async
 from . import model_async
+from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
+from app.processing.video_handler import format_time_display as video_format_time, format_single_time
 
 log_debug("ui.handlers.async_logic module initialized.")
 
@@ -46,11 +48,9 @@ def run_model_load_in_thread(selected_model_key, stop_all_processing_logic_ref):
 # Utility functions for backward compatibility and coordination
 def get_async_operations_status():
     """Get status of ongoing async operations."""
-    from app.core import globals as app_globals
-    
     status = {
         'video_playing': app_globals.is_playing_via_after_loop,
-        'video_paused': app_globals.video_paused_flag.is_set(),
+        'video_paused': app_globals.video_paused,
         'fast_processing_active': app_globals.fast_processing_active_flag.is_set(),
         'stop_flag_set': app_globals.stop_video_processing_flag.is_set(),
         'model_loaded': app_globals.active_model_object_global is not None,
@@ -80,10 +80,9 @@ def initialize_async_modules():
 # These can be removed once all references are updated
 def format_time_display(current_seconds, total_seconds=None):
     """Legacy time formatting - delegates to video handler."""
-    from app.processing.video_handler import format_time_display as video_format_time
     if total_seconds is not None:
-        return f"{video_format_time(current_seconds)} / {video_format_time(total_seconds)}"
-    return video_format_time(current_seconds)
+        return video_format_time(current_seconds, total_seconds)
+    return format_single_time(current_seconds)
 
 
 # Module initialization
\ No newline at end of file
@@ -3,26 +3,51 @@ Control Handlers Module
 Handles UI control interactions including process buttons, video controls, and sliders.
 """
 import time
-import cv2
-from tkinter import messagebox
 
 from . import shared_refs as refs
 from . import loading_manager
 from . import file_async
 from . import video_async
 from . import seek_optimizer
+from app import config
 from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
-from app.processing.video_handler import format_time_display
+from app.processing.video_handler import (
+    format_time_display, get_cached_capture, evict_cached_captures, publish_video_meta, rewind_capture,
+    get_capture_info,
+)
 
 log_debug("ui.handlers.control_handlers module initialized.")
 
+_cached_root = None
+_last_drag_label_frame = None # Frame the drag labels currently show; sub-frame slider moves skip the Tk calls
+_last_drag_time_text = None # Time label text shown by the current drag; it changes only once per whole second
+_drag_label_update_pending = False # An after_idle label refresh is queued; further drag events only store their frame
+_pending_start_token = None # Token of the capture open in flight; Play stays disabled until it lands
+
+
+def _root():
+    """Return the root window, memoized after the first successful lookup."""
+    global _cached_root
+    if _cached_root is None:
+        _cached_root = refs.get_root()
+    return _cached_root
+
+
+def _invalidate_cached_root():
+    """Forget the memoized root window."""
+    global _cached_root
+    _cached_root = None
+
+
+refs.register_root_cache_invalidator(_invalidate_cached_root)
+
 
 def on_process_button_click():
     """Handle process button click for real-time processing."""
     log_debug("on_process_button_click: 'Process Real-time' button pressed.")
     
-    root = refs.get_root()
+    root = _root()
     ui_comps = refs.ui_components
     
     if not ui_comps or root is None or not root.winfo_exists():
@@ -31,12 +56,12 @@ def on_process_button_click():
     
     if not app_globals.active_model_object_global:
         log_debug("Process button: No model loaded.")
-        messagebox.showwarning("No Model", "Please select and load a model before processing.")
+        refs.show_toast("No Model", "Please select and load a model before processing.", "warning")
         return
     
     if not app_globals.current_uploaded_file_path_global and not app_globals.uploaded_file_info.get('path'):
         log_debug("Process button: No file uploaded.")
-        messagebox.showwarning("No File", "Please upload a file before processing.")
+        refs.show_toast("No File", "Please upload a file before processing.", "warning")
         return
     
     file_path = app_globals.current_uploaded_file_path_global or app_globals.uploaded_file_info.get('path')
@@ -51,56 +76,160 @@ def on_process_button_click():
     # Handle video file
     if not file_path.lower().endswith(('.mp4', '.avi', '.mov', '.mkv')):
         log_debug("Process button: Unsupported file type.")
-        messagebox.showerror("Unsupported File", "Please upload a supported image or video file.")
+        refs.show_toast("Unsupported File", "Please upload a supported image or video file.", "error")
         return
     
     log_debug("Process button: Starting real-time video processing.")
     
     # Reset video processing flags
     app_globals.stop_video_processing_flag.clear()
-    app_globals.video_paused_flag.clear()
+    app_globals.video_paused = False
     
+    try:
+        _start_playback(file_path, 0)
+    except Exception as e:
+        log_debug(f"Error starting real-time processing: {e}", exc_info=True)
+        refs.show_toast("Processing Error", f"Failed to start real-time processing: {str(e)}", "error")
+
+
+def _start_playback(file_path, start_frame):
+    """Open, rewind and probe file_path on its own daemon thread, then start playback at start_frame on the Tk thread."""
+    # Each of these can block (and the lock may be held by a seek or the decoder); the worker
+    # reuses the cached capture and posts its metadata back via _kickoff_playback_loop.
+    global _pending_start_token
+    app_globals.playback_start_token += 1
+    _pending_start_token = token = app_globals.playback_start_token
+    refs.set_button_state("process_button", True)
+    refs.set_button_state("play_pause_button", True)
+    refs.run_in_daemon_thread(_open_video_worker, file_path, start_frame, token)
+
+
+def _cancel_pending_start():
+    """Invalidate an in-flight capture open; returns True if one was pending (main thread)."""
+    global _pending_start_token
+    pending = _pending_start_token is not None and _pending_start_token == app_globals.playback_start_token
+    _pending_start_token = None
+    app_globals.playback_start_token += 1
+    return pending
+
+
+def _open_video_worker(file_path, start_frame, token):
+    """Open (or reuse) the capture for file_path off the Tk thread, then hand off to the main thread."""
+    root = _root()
     try:
         with app_globals.video_access_lock:
-            if app_globals.video_capture_global is None or not app_globals.video_capture_global.isOpened():
-                log_debug("Process button: Video capture not available.")
-                messagebox.showerror("Video Error", "Video file is not properly loaded.")
+            if token != app_globals.playback_start_token:
+                log_debug(f"_open_video_worker: Start for {file_path} was cancelled; not publishing the capture.")
                 return
-            
-            # Reset to beginning
-            app_globals.video_capture_global.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            app_globals.current_frame_number_global = 0
+            cap = get_cached_capture(file_path)
+            if cap is not None:
+                rewind_capture(cap, start_frame)
+                info = get_capture_info(file_path, cap)
+                fps, total_frames = info.fps, info.total_frames
+            app_globals.video_capture_global = cap
         
-        # Update UI buttons
-        ui_comps["play_pause_button"].config(text="Pause", state="normal")
-        ui_comps["stop_button"].state(['!disabled'])
-        ui_comps["process_button"].state(['disabled'])
-        ui_comps["fast_process_button"].state(['disabled'])
-        log_debug("Play/Pause and Stop buttons configured for active real-time processing.")
+        if cap is None:
+            log_debug(f"_open_video_worker: Could not open video capture for {file_path}.")
+            if root: root.after(0, _on_video_open_failed, "Could not open the video file for playback.", token)
+            return
         
-        # Start video playback loop
+        meta = {
+            'start_frame': start_frame,
+            'fps': fps,
+            'total_frames': total_frames,
+            'duration_seconds': total_frames / fps if fps > 0 else 0
+        }
+        log_debug(f"_open_video_worker: Capture ready for {file_path}: {meta}")
+        if root: root.after(0, _kickoff_playback_loop, meta, token)
+    except Exception as e:
+        log_debug(f"_open_video_worker: Error opening {file_path}: {e}", exc_info=True)
+        if root: root.after(0, _on_video_open_failed, f"Error opening video: {e}", token)
+
+
+def _restore_idle_play_controls():
+    """Show Play and re-enable the start buttons (main thread)."""
+    ui_comps = refs.ui_components
+    if ui_comps and ui_comps.get("play_pause_button"):
+        ui_comps["play_pause_button"].config(text="Play")
+    refs.set_button_state("play_pause_button", False)
+    refs.set_button_state("process_button", False)
+
+
+def _on_video_open_failed(message, token):
+    """Restore idle controls after a failed background open (main thread)."""
+    global _pending_start_token
+    if token != app_globals.playback_start_token:
+        log_debug("_on_video_open_failed: Start was cancelled; ignoring the failure.")
+        return
+    _pending_start_token = None
+    _restore_idle_play_controls()
+    refs.show_toast("Video Error", message, "error")
+
+
+def _kickoff_playback_loop(meta, token):
+    """Apply video metadata, configure controls and start the playback loop (main thread)."""
+    global _pending_start_token
+    if token != app_globals.playback_start_token:
+        log_debug("_kickoff_playback_loop: Start was cancelled by Stop or a new upload; not starting playback.")
+        return
+    _pending_start_token = None
+    ui_comps = refs.ui_components
+    if not ui_comps:
+        return
+    
+    if 'total_frames' in meta:
+        app_globals.fps_global = meta['fps']
+        app_globals.total_frames_global = meta['total_frames']
+        publish_video_meta(meta['fps'], meta['total_frames'])
+    app_globals.current_frame_number_global = meta.get('start_frame', 0)
+    app_globals.current_video_meta['current_frame'] = app_globals.current_frame_number_global
+    
+    app_globals.stop_video_processing_flag.clear()
+    app_globals.video_paused = False
+    app_globals.frame_skip_stride = 1
+    
+    # Update UI buttons
+    ui_comps["play_pause_button"].config(text="Pause")
+    refs.set_button_state("play_pause_button", False)
+    refs.set_button_state("stop_button", False)
+    refs.set_button_state("process_button", True)
+    refs.set_button_state("fast_process_button", True)
+    log_debug("Play/Pause and Stop buttons configured for active real-time processing.")
+    
+    # Start video playback loop
+    if not app_globals.is_playing_via_after_loop:
         app_globals.is_playing_via_after_loop = True
         video_async._video_playback_loop()
-        
-        log_debug("Real-time video processing started.")
-        
-    except Exception as e:
-        log_debug(f"Error starting real-time processing: {e}", exc_info=True)
-        messagebox.showerror("Processing Error", f"Failed to start real-time processing: {str(e)}")
+    
+    log_debug("Real-time video processing started.")
 
 
 def on_fast_process_button_click(stop_all_processing_logic_ref):
     """Handle fast process button click."""
     log_debug("on_fast_process_button_click: 'Fast Process Video' button pressed.")
     
+    root = _root()
+    if root is None or not root.winfo_exists():
+        log_debug("Fast process button: Root window not available.")
+        return
+    
+    # Show the loader first so it paints before any validation work runs.
+    loading_manager.show_loading("Preparing...")
+    root.after_idle(_start_fast_processing, stop_all_processing_logic_ref)
+
+
+def _start_fast_processing(stop_all_processing_logic_ref):
+    """Validate fast processing preconditions and start the worker thread."""
     if not app_globals.active_model_object_global:
         log_debug("Fast process button: No model loaded.")
-        messagebox.showwarning("No Model", "Please select and load a model before processing.")
+        loading_manager.hide_loading_and_update_controls()
+        refs.show_toast("No Model", "Please select and load a model before processing.", "warning")
         return
     
     if not app_globals.current_uploaded_file_path_global and not app_globals.uploaded_file_info.get('path'):
         log_debug("Fast process button: No file uploaded.")
-        messagebox.showwarning("No File", "Please upload a video file before processing.")
+        loading_manager.hide_loading_and_update_controls()
+        refs.show_toast("No File", "Please upload a video file before processing.", "warning")
         return
     
     uploaded_file_path = app_globals.current_uploaded_file_path_global or app_globals.uploaded_file_info.get('path')
@@ -112,7 +241,7 @@ def toggle_play_pause():
     """Toggle between play and pause for video playback."""
     log_debug("toggle_play_pause: Play/Pause button pressed.")
     
-    root = refs.get_root()
+    root = _root()
     ui_comps = refs.ui_components
     
     if not ui_comps or root is None or not root.winfo_exists():
@@ -132,137 +261,169 @@ def toggle_play_pause():
         if app_globals.video_capture_global is None:
             log_debug(f"Play: video_capture_global is None. Checking current_uploaded_file_path_global: {app_globals.current_uploaded_file_path_global}")
             if app_globals.current_uploaded_file_path_global:
-                log_debug(f"Play: Attempting to re-initialize video capture for {app_globals.current_uploaded_file_path_global}.")
-                try:
-                    app_globals.video_capture_global = cv2.VideoCapture(app_globals.current_uploaded_file_path_global)
-                    if not app_globals.video_capture_global.isOpened():
-                        log_debug(f"Play: CRITICAL - Failed to re-initialize video capture for {app_globals.current_uploaded_file_path_global} after stop. Capture object did not open.")
-                        app_globals.video_capture_global = None # Ensure it's None if failed
-                        messagebox.showerror("Video Error", "Could not re-open video file for playback after stopping.")
-                        return # Critical failure, cannot proceed with play
-                    else:
-                        log_debug(f"Play: Successfully re-initialized video capture for {app_globals.current_uploaded_file_path_global}.")
-                        # Reset frame position to current if available, or 0. Important after stop.
-                        target_frame = app_globals.current_frame_number_global # This should be 0 after stop
-                        app_globals.video_capture_global.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-                        log_debug(f"Play: Set video position to frame {target_frame} after re-initialization.")
-                except Exception as e_reinit:
-                    log_debug(f"Play: CRITICAL - Exception during video re-initialization for {app_globals.current_uploaded_file_path_global}: {e_reinit}", exc_info=True)
-                    app_globals.video_capture_global = None
-                    messagebox.showerror("Video Error", f"Error re-opening video: {e_reinit}")
-                    return # Critical failure
+                log_debug(f"Play: Re-opening video capture for {app_globals.current_uploaded_file_path_global} in the background.")
+                # Resume from the current position (0 after stop) once the capture is ready.
+                play_pause_btn.config(text="Pause")
+                _start_playback(app_globals.current_uploaded_file_path_global, app_globals.current_frame_number_global)
+                return
             else:
                 log_debug("Play: Video capture not available and no video path stored. Cannot start playback.")
                 # Potentially show a message or ensure UI reflects no video is playable
-                if ui_comps and ui_comps.get("play_pause_button"):
-                    ui_comps["play_pause_button"].config(text="Play")
-                    ui_comps["play_pause_button"].state(['disabled'])
+                play_pause_btn.config(text="Play")
+                refs.set_button_state("play_pause_button", True)
                 return 
         
-        app_globals.video_paused_flag.clear()
+        app_globals.video_paused = False
         app_globals.stop_video_processing_flag.clear()
+        app_globals.frame_skip_stride = 1
         
         if not app_globals.is_playing_via_after_loop:
             app_globals.is_playing_via_after_loop = True
             video_async._video_playback_loop()
         
         play_pause_btn.config(text="Pause")
-        if ui_comps.get("process_button"):
-            ui_comps["process_button"].state(['disabled'])
+        refs.set_button_state("process_button", True)
         
     elif current_text == "Pause":
         log_debug("Pausing video playback.")
-        app_globals.video_paused_flag.set()
+        app_globals.video_paused = True
         play_pause_btn.config(text="Play")
-        if ui_comps.get("process_button"):
-            ui_comps["process_button"].state(['!disabled'])
+        refs.set_button_state("process_button", False)
 
 
 def stop_video_stream_button_click(stop_all_processing_logic_ref):
     """Handle stop button click to stop video processing."""
     log_debug("stop_video_stream_button_click: Stop button pressed.")
     
-    root = refs.get_root()
+    root = _root()
     ui_comps = refs.ui_components
     
     if not ui_comps or root is None or not root.winfo_exists():
         log_debug("Stop button: UI components or root window not available.")
         return
     
+    # A capture open still in flight must not start playback after Stop
+    if _cancel_pending_start():
+        log_debug("Stop button: Cancelled the pending playback start.")
+        _restore_idle_play_controls()
+
+    # Nothing playing and already showing frame 0 (slider included, so pending seeks count): nothing to reset
+    progress_var = ui_comps.get("progress_var")
+    if (not app_globals.is_playing_via_after_loop and not app_globals.fast_processing_active_flag.is_set()
+            and app_globals.current_frame_number_global == 0 and progress_var is not None and progress_var.get() == 0):
+        log_debug("Stop button: already stopped at frame 0; nothing to do.")
+        return
+    
     # Stop all processing
     if stop_all_processing_logic_ref:
         stop_all_processing_logic_ref()
     
     # Cancel any pending seek operations
     seek_optimizer.cancel_all_seeks()
+
+    # Keep cached captures only for files that are still part of the session
+    with app_globals.video_access_lock:
+        evict_cached_captures(keep_paths={app_globals.uploaded_file_info.get('path'), app_globals.current_uploaded_file_path_global})
     
     # Reset UI state
-    if ui_comps.get("play_pause_button"):
-        ui_comps["play_pause_button"].config(text="Play")
+    get_component = ui_comps.get
+    play_pause_btn = get_component("play_pause_button")
+    if play_pause_btn:
+        play_pause_btn.config(text="Play")
     
-    if ui_comps.get("process_button"):
-        ui_comps["process_button"].state(['!disabled'])
+    refs.set_button_state("process_button", False)
     
     # Reset video to beginning if video is loaded
-    if app_globals.video_capture_global and app_globals.video_capture_global.isOpened():
-        with app_globals.video_access_lock:
-            app_globals.video_capture_global.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            ret, first_frame = app_globals.video_capture_global.read()
-            app_globals.video_capture_global.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            
-            if ret and ui_comps.get("video_display"):
-                ui_comps["video_display"].update_frame(first_frame)
-        
+    video_display = get_component("video_display")
+    has_cached_first_frame = app_globals.uploaded_file_info.get('file_type') == 'video' and app_globals.cached_first_frame_bgr is not None
+    if has_cached_first_frame and video_display:
+        # Blit the pre-rendered first frame; only rebuild it if the display was resized since upload.
+        if not video_display.blit_cached(app_globals.cached_first_photoimage, app_globals.cached_first_frame_bgr):
+            video_display.update_frame(app_globals.cached_first_frame_bgr)
+            loading_manager.cache_first_frame_photo(app_globals.cached_first_frame_bgr)
+
+    if has_cached_first_frame or (app_globals.video_capture_global and app_globals.video_capture_global.isOpened()):
+        if not has_cached_first_frame:
+            with app_globals.video_access_lock:
+                rewind_capture(app_globals.video_capture_global, 0)
+                ret, first_frame = app_globals.video_capture_global.read()
+                rewind_capture(app_globals.video_capture_global, 0)
+
+                if ret and video_display:
+                    video_display.update_frame(first_frame)
+
         app_globals.current_frame_number_global = 0
         app_globals.current_video_meta['current_frame'] = 0
-        ui_comps["progress_var"].set(0)
-        
-        current_time_sec = 0
-        total_time_sec = app_globals.current_video_meta.get('duration_seconds', 0)
-        ui_comps["time_label"].config(text=format_time_display(current_time_sec, total_time_sec))
-        ui_comps["current_frame_label"].config(text=f"Frame: 0 / {app_globals.current_video_meta.get('total_frames', 0)}")
+        meta = app_globals.video_meta_snapshot
+        progress_var.set(0)
+        get_component("time_label").config(text=format_time_display(0, meta.duration_s))
+        get_component("current_frame_label").config(text=f"Frame: 0 / {meta.total_frames}")
     
     log_debug("Video stream stopped and UI reset.")
 
 
 def handle_slider_value_change(*args):
     """Handle progress slider value changes with optimized seeking."""
-    ui_comps = refs.ui_components
-    
-    if not ui_comps or not ui_comps.get("progress_var"):
+    global _drag_label_update_pending
+    # Cheapest checks first: playback-driven writes are programmatic, and a playing
+    # video only needs this handler while the user is dragging (label preview).
+    if app_globals.is_programmatic_slider_update or (app_globals.is_playing_via_after_loop and not app_globals.is_slider_being_dragged):
         return
-    
-    if app_globals.is_programmatic_slider_update:
+
+    ui_comps = refs.ui_components
+    progress_var = ui_comps.get("progress_var") if ui_comps else None
+    if not progress_var:
         return
 
-    target_frame = ui_comps["progress_var"].get()
-    total_frames = app_globals.current_video_meta.get('total_frames', 0)
+    meta = app_globals.video_meta_snapshot
+    total_frames = meta.total_frames
     if total_frames <= 0:
         return
-    target_frame = max(0, min(target_frame, total_frames - 1))
+    target_frame = max(0, min(progress_var.get(), total_frames - 1))
 
-    # Update UI labels immediately if dragging
+    # While dragging, only record the frame; one idle-time refresh per burst of motion events updates the labels
     if app_globals.is_slider_being_dragged:
-        fps = app_globals.current_video_meta.get('fps', 30.0)
-        current_time_sec = target_frame / fps if fps > 0 else 0
-        total_time_sec = app_globals.current_video_meta.get('duration_seconds', 0)
-        if ui_comps.get("time_label"):
-            ui_comps["time_label"].config(text=format_time_display(current_time_sec, total_time_sec))
-        if ui_comps.get("current_frame_label"):
-            ui_comps["current_frame_label"].config(text=f"Frame: {target_frame} / {total_frames}")
+        app_globals.slider_target_frame_value = target_frame
+        if not _drag_label_update_pending:
+            root = _root()
+            if root is not None:
+                _drag_label_update_pending = True
+                root.after_idle(_apply_drag_label_update)
         return # Don't seek while dragging, only on release
     
-    # Original logic for non-drag scenarios (e.g., arrow keys, or if not playing)
-    if app_globals.is_playing_via_after_loop:
-        return
-    
+    # Non-drag scenarios (e.g., arrow keys) only reach here when not playing
     if not app_globals.video_capture_global or not app_globals.video_capture_global.isOpened():
         return
     
     is_real_time = ui_comps.get("play_pause_button") and ui_comps["play_pause_button"].cget("text") == "Pause"
+    # The seek worker waits for the slider to settle (timestamp gate), so no Tk-side timer is needed here
     seek_optimizer.request_seek(target_frame, is_real_time_mode=is_real_time, force_immediate=False)
 
 
+def _apply_drag_label_update():
+    """Show the latest dragged-to frame in the time and frame labels."""
+    global _drag_label_update_pending, _last_drag_label_frame, _last_drag_time_text
+    _drag_label_update_pending = False
+    target_frame = app_globals.slider_target_frame_value
+    if target_frame == _last_drag_label_frame:
+        return
+    _last_drag_label_frame = target_frame
+    ui_comps = refs.ui_components
+    if not ui_comps:
+        return
+    meta = app_globals.video_meta_snapshot
+    current_time_sec = target_frame / meta.fps if meta.fps > 0 else 0
+    time_label = ui_comps.get("time_label")
+    time_text = format_time_display(current_time_sec, meta.duration_s)
+    # While playing, the playback loop also writes the label, so the cached text cannot be trusted
+    if time_label and (time_text != _last_drag_time_text or app_globals.is_playing_via_after_loop):
+        time_label.config(text=time_text)
+        _last_drag_time_text = time_text
+    frame_label = ui_comps.get("current_frame_label")
+    if frame_label:
+        frame_label.config(text=f"Frame: {target_frame} / {meta.total_frames}")
+
+
 def _execute_slider_seek():
     """Legacy function - now handled by optimized seek system."""
     # This function is kept for compatibility but functionality moved to handle_slider_value_change
@@ -271,7 +432,10 @@ def _execute_slider_seek():
 
 def handle_slider_click_press(event):
     """Handle slider click press event to calculate exact position from click coordinates."""
+    global _last_drag_label_frame, _last_drag_time_text
     seek_optimizer.cancel_all_seeks() # Cancel any ongoing seeks immediately
+    _last_drag_label_frame = None
+    _last_drag_time_text = None
     app_globals.is_slider_being_dragged = True # Set drag flag
     ui_comps = refs.ui_components
     
@@ -281,14 +445,14 @@ def handle_slider_click_press(event):
     if not app_globals.video_capture_global or not app_globals.video_capture_global.isOpened():
         return
     
-    total_frames = app_globals.current_video_meta.get('total_frames', 0)
+    total_frames = app_globals.video_meta_snapshot.total_frames
     if total_frames <= 0:
         return
     
     slider = ui_comps["progress_slider"]
     
     # Calculate the relative position of the click (0.0 to 1.0)
-    slider_width = slider.winfo_width()
+    slider_width = app_globals.progress_slider_width or slider.winfo_width()
     click_x = event.x
     
     # Account for slider padding/margins - Tkinter Scale has some internal padding
@@ -297,24 +461,21 @@ def handle_slider_click_press(event):
     effective_width = max(1, slider_width - 2 * padding)
     adjusted_x = max(0, click_x - padding)
     
-    relative_pos = max(0.0, min(1.0, adjusted_x / effective_width))
+    # Convert to frame number with integer math
+    target_frame = max(0, min((adjusted_x * (total_frames - 1)) // effective_width, total_frames - 1))
     
-    # Convert to frame number
-    target_frame = int(relative_pos * (total_frames - 1))
-    target_frame = max(0, min(target_frame, total_frames - 1))
-    
-    progress_percentage = (target_frame / total_frames) * 100 if total_frames > 0 else 0
-    log_debug(f"Slider click press: Click at x={click_x}, width={slider_width}, relative_pos={relative_pos:.3f}, target_frame={target_frame} ({progress_percentage:.1f}%)")
+    if config.IS_DEBUG_MODE:
+        relative_pos = min(1.0, adjusted_x / effective_width)
+        progress_percentage = (target_frame / total_frames) * 100
+        log_debug(f"Slider click press: Click at x={click_x}, width={slider_width}, relative_pos={relative_pos:.3f}, target_frame={target_frame} ({progress_percentage:.1f}%)")
     
     # Set the slider value directly to override Tkinter's default behavior
-    app_globals.is_programmatic_slider_update = True
-    try:
-        ui_comps["progress_var"].set(target_frame)
-    finally:
-        app_globals.is_programmatic_slider_update = False
+    refs.set_progress_silently(target_frame)
     
     # Trigger immediate seek
     is_real_time = ui_comps.get("play_pause_button") and ui_comps["play_pause_button"].cget("text") == "Pause"
+    app_globals.pending_seek_frame = target_frame
+    app_globals.last_seek_request_time = time.perf_counter()
     seek_optimizer.request_seek(target_frame, is_real_time_mode=is_real_time, force_immediate=True)
 
 
@@ -333,7 +494,7 @@ def handle_slider_click_release(event):
         log_debug("Slider click: No video loaded.")
         return
     
-    total_frames = app_globals.current_video_meta.get('total_frames', 0)
+    total_frames = app_globals.video_meta_snapshot.total_frames
     if total_frames <= 0:
         log_debug("Slider click: Invalid total frames.")
         return
@@ -347,6 +508,14 @@ def handle_slider_click_release(event):
         log_debug(f"Slider click release: Already at target frame {target_frame}, skipping duplicate seek")
         return
     
+    # A plain click already requested this position on press; re-requesting would cancel that seek mid-flight
+    pending_frame = app_globals.pending_seek_frame
+    app_globals.pending_seek_frame = None
+    if (pending_frame is not None and abs(pending_frame - target_frame) <= 2
+            and time.perf_counter() - app_globals.last_seek_request_time < config.SLIDER_RELEASE_COALESCE_S):
+        log_debug(f"Slider click release: Press already seeking to frame {pending_frame}, skipping duplicate seek")
+        return
+    
     progress_percentage = (target_frame / total_frames) * 100 if total_frames > 0 else 0
     log_debug(f"Slider click seek: Moving to frame {target_frame} ({progress_percentage:.1f}%)")
     
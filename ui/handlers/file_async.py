@@ -3,7 +3,6 @@ File Async Operations Module
 Handles file upload processing, image processing, and related UI updates in separate threads.
 """
 import os
-import threading
 import time
 import cv2
 import mimetypes
@@ -12,12 +11,48 @@ from . import shared_refs as refs
 from . import loading_manager
 from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
-from app.processing.frame_processor import process_frame_yolo
-from app.processing.video_handler import format_time_display, _cleanup_processed_video_temp_file
+from app.processing.frame_processor import process_frame_yolo, predict_raw_detections, reapply_thresholds
+from app.processing.video_handler import (
+    format_time_display, _cleanup_processed_video_temp_file, _cleanup_preview_video_file, start_preview_transcode,
+    get_cached_capture, evict_cached_captures, release_capture,
+    publish_video_meta, clear_video_meta, rewind_capture, get_capture_info,
+)
 
 log_debug("ui.handlers.file_async module initialized.")
 
 
+def get_uploaded_image_bgr():
+    """Return the decoded uploaded image, decoding and caching it on first use."""
+    img = app_globals.uploaded_image_bgr
+    if img is None and app_globals.current_uploaded_file_path_global:
+        img = cv2.imread(app_globals.current_uploaded_file_path_global)
+        app_globals.uploaded_image_bgr = img
+    return img
+
+
+def get_raw_detections(img):
+    """Return the cached candidate boxes for img and the active model, running the model only on a miss."""
+    model = app_globals.active_model_object_global
+    raw = app_globals.raw_yolo_result
+    if raw is not None and raw['source'] is img and raw['model'] is model:
+        return raw
+    raw = predict_raw_detections(img, model)
+    raw.update(source=img, model=model)
+    app_globals.raw_yolo_result = raw
+    return raw
+
+
+def process_image_with_thresholds(img, conf_thresh=None, iou_thresh=None, out=None):
+    """Annotate img at the given (default: current) thresholds, reusing the cached forward pass."""
+    return reapply_thresholds(
+        img, get_raw_detections(img), app_globals.active_class_list_global,
+        active_filter_list=app_globals.active_processed_class_filter_global,
+        current_conf_thresh=app_globals.conf_threshold_global if conf_thresh is None else conf_thresh,
+        current_iou_thresh=app_globals.iou_threshold_global if iou_thresh is None else iou_thresh,
+        out=out
+    )
+
+
 def _process_uploaded_file_in_thread(file_path, stop_all_processing_logic_ref):
     """Process uploaded file (image or video) in a separate thread."""
     log_debug(f"Thread started for processing file: {file_path}")
@@ -39,29 +74,19 @@ def _process_uploaded_file_in_thread(file_path, stop_all_processing_logic_ref):
         app_globals.current_frame_number_global = 0
         
         # Update video metadata for compatibility
-        app_globals.current_video_meta.update({
-            'fps': fps,
-            'total_frames': total_frames,
-            'duration_seconds': total_frames / fps if fps > 0 else 0,
-            'current_frame': 0
-        })
+        publish_video_meta(fps, total_frames, current_frame=0)
         
         if ui_comps.get("progress_slider"):
             ui_comps["progress_slider"].state(['!disabled'])
-        if ui_comps.get("play_pause_button"):
-            ui_comps["play_pause_button"].state(['!disabled'])
-        if ui_comps.get("stop_button"):
-            ui_comps["stop_button"].state(['!disabled'])
+        refs.set_button_state("play_pause_button", False)
+        refs.set_button_state("stop_button", False)
         
         ui_comps["time_label"].config(text=format_time_display(0, total_frames / fps if fps > 0 else 0))
         ui_comps["current_frame_label"].config(text=f"Frame: 0 / {total_frames}")
         ui_comps["fps_label"].config(text=f"FPS: {fps:.1f}")
         
-        if ui_comps.get("fast_process_button"):
-            ui_comps["fast_process_button"].state(['!disabled'])
-        
-        if ui_comps.get("process_button"):
-            ui_comps["process_button"].state(['!disabled'])
+        refs.set_button_state("fast_process_button", False)
+        refs.set_button_state("process_button", False)
     
     try:
         # Stop any ongoing processing
@@ -89,7 +114,10 @@ def _process_uploaded_file_in_thread(file_path, stop_all_processing_logic_ref):
         log_debug(f"File type determined in thread: {file_type}, mime: {mime_type}")
         
         _cleanup_processed_video_temp_file()
+        _cleanup_preview_video_file()
         app_globals.current_uploaded_file_path_global = file_path
+        app_globals.uploaded_image_bgr = None
+        app_globals.raw_yolo_result = None
         
         # Update uploaded_file_info for loading manager compatibility
         file_name = os.path.basename(file_path)
@@ -107,17 +135,15 @@ def _process_uploaded_file_in_thread(file_path, stop_all_processing_logic_ref):
                 raise ValueError(f"Could not read image file: {file_path}")
             
             height, width = img.shape[:2]
-            app_globals.current_unprocessed_image_for_display = img.copy()
+            app_globals.uploaded_image_bgr = img
+            # Nothing mutates the decoded image (drawing works on its own copy), so share it instead of cloning
+            app_globals.current_unprocessed_image_for_display = img
             
-            display_img = img.copy()
+            display_img = img
             
             if app_globals.active_model_object_global:
                 log_debug("Model loaded, processing uploaded image immediately.")
-                processed_img, detected_count = process_frame_yolo(
-                    img, app_globals.active_model_object_global, app_globals.active_class_list_global,
-                    is_video_mode=False, active_filter_list=app_globals.active_processed_class_filter_global,
-                    current_conf_thresh=app_globals.conf_threshold_global, current_iou_thresh=app_globals.iou_threshold_global
-                )
+                processed_img, detected_count = process_image_with_thresholds(img)
                 app_globals.current_processed_image_for_display = processed_img
                 display_img = processed_img
                 if root and root.winfo_exists():
@@ -139,27 +165,24 @@ def _process_uploaded_file_in_thread(file_path, stop_all_processing_logic_ref):
             log_debug("Video file: setting up video capture in thread...")
             
             with app_globals.video_access_lock:
-                if app_globals.video_capture_global:
-                    app_globals.video_capture_global.release()
+                release_capture(app_globals.video_capture_global)
+                evict_cached_captures(keep_paths={file_path})
                 
-                app_globals.video_capture_global = cv2.VideoCapture(file_path)
+                app_globals.video_capture_global = get_cached_capture(file_path)
                 
-                if not app_globals.video_capture_global.isOpened():
+                if app_globals.video_capture_global is None:
                     raise ValueError(f"Could not open video file: {file_path}")
                 
-                fps = app_globals.video_capture_global.get(cv2.CAP_PROP_FPS)
-                total_frames = int(app_globals.video_capture_global.get(cv2.CAP_PROP_FRAME_COUNT))
-                width = int(app_globals.video_capture_global.get(cv2.CAP_PROP_FRAME_WIDTH))
-                height = int(app_globals.video_capture_global.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                fps, total_frames, width, height = get_capture_info(file_path, app_globals.video_capture_global)
                 
                 log_debug(f"Video properties: FPS={fps}, Frames={total_frames}, Size={width}x{height}")
                 
                 # Read and display first frame
                 ret, first_frame = app_globals.video_capture_global.read()
-                app_globals.video_capture_global.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                rewind_capture(app_globals.video_capture_global, 0)
                 
                 if ret:
-                    display_frame = first_frame.copy()
+                    display_frame = first_frame
                     if app_globals.active_model_object_global:
                         processed_first_frame, _ = process_frame_yolo(
                             first_frame, app_globals.active_model_object_global, app_globals.active_class_list_global,
@@ -171,11 +194,13 @@ def _process_uploaded_file_in_thread(file_path, stop_all_processing_logic_ref):
                     
                     if root and root.winfo_exists():
                         def update_video_display():
+                            loading_manager.cache_first_frame_photo(first_frame)
                             if ui_comps.get("video_display"):
                                 ui_comps["video_display"].update_frame(display_frame)
                             update_video_ui_on_upload(fps, total_frames, width, height)
                         root.after(0, update_video_display)
-                
+            
+            start_preview_transcode(file_path, total_frames / fps if fps > 0 else 0)
             success = True
         else:
             raise ValueError(f"Unsupported file type: {file_path}")
@@ -211,15 +236,11 @@ def run_image_processing_in_thread(file_path):
             print(f"Processed image. Detected {detection_count} objects.")
         
         try:
-            img = cv2.imread(file_path)
+            img = get_uploaded_image_bgr() if file_path == app_globals.current_uploaded_file_path_global else cv2.imread(file_path)
             if img is None: 
                 raise ValueError(f"Could not read image file: {file_path}")
 
-            processed_img, detected_count = process_frame_yolo(
-                img, app_globals.active_model_object_global, app_globals.active_class_list_global,
-                is_video_mode=False, active_filter_list=app_globals.active_processed_class_filter_global,
-                current_conf_thresh=app_globals.conf_threshold_global, current_iou_thresh=app_globals.iou_threshold_global
-            )
+            processed_img, detected_count = process_image_with_thresholds(img)
             app_globals.current_processed_image_for_display = processed_img
 
             root = refs.get_root()
@@ -235,8 +256,8 @@ def run_image_processing_in_thread(file_path):
             if root and root.winfo_exists():
                 root.after(0, loading_manager.hide_loading_and_update_controls)
     
-    threading.Thread(target=process_image_task, daemon=True).start()
-    log_debug("Image processing thread started.")
+    refs.submit_background(process_image_task)
+    log_debug("Image processing job submitted.")
 
 
 def reinitialize_video_capture(file_path):
@@ -248,34 +269,26 @@ def reinitialize_video_capture(file_path):
 
     try:
         with app_globals.video_access_lock:
-            if app_globals.video_capture_global:
-                app_globals.video_capture_global.release()
+            release_capture(app_globals.video_capture_global)
             
-            app_globals.video_capture_global = cv2.VideoCapture(file_path)
+            app_globals.video_capture_global = get_cached_capture(file_path)
             
-            if not app_globals.video_capture_global.isOpened():
+            if app_globals.video_capture_global is None:
                 raise ValueError(f"Could not re-open video file: {file_path}")
             
-            fps = app_globals.video_capture_global.get(cv2.CAP_PROP_FPS)
-            total_frames = int(app_globals.video_capture_global.get(cv2.CAP_PROP_FRAME_COUNT))
-            width = int(app_globals.video_capture_global.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(app_globals.video_capture_global.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            info = get_capture_info(file_path, app_globals.video_capture_global)
+            fps, total_frames = info.fps, info.total_frames
             
-            app_globals.current_video_meta.update({
-                'fps': fps,
-                'total_frames': total_frames,
-                'duration_seconds': total_frames / fps if fps > 0 else 0,
-                'current_frame': 0
-            })
+            publish_video_meta(fps, total_frames, current_frame=0)
             app_globals.current_frame_number_global = 0 # Ensure consistency with metadata
             
             # Read first frame for display
             ret, first_frame = app_globals.video_capture_global.read()
             # IMPORTANT: Reset to frame 0 after reading the first frame, so playback/processing starts from beginning
-            app_globals.video_capture_global.set(cv2.CAP_PROP_POS_FRAMES, 0) 
+            rewind_capture(app_globals.video_capture_global, 0) 
 
             if ret and first_frame is not None:
-                display_frame = first_frame.copy()
+                display_frame = first_frame
                 if app_globals.active_model_object_global: # Model is now loaded
                     log_debug(f"Re-initializing video: Processing first frame with model {app_globals.active_model_key}")
                     processed_first_frame, _ = process_frame_yolo(
@@ -289,6 +302,7 @@ def reinitialize_video_capture(file_path):
                 # hide_loading_and_update_controls will handle other UI elements based on updated app_globals.current_video_meta
                 if root and root.winfo_exists() and ui_comps and ui_comps.get("video_display"):
                     def update_disp_frame(d_frame):
+                        loading_manager.cache_first_frame_photo(first_frame)
                         if ui_comps.get("video_display"):
                              ui_comps["video_display"].update_frame(d_frame)
                     root.after(0, lambda d_f=display_frame: update_disp_frame(d_f))
@@ -298,9 +312,9 @@ def reinitialize_video_capture(file_path):
     except Exception as e:
         log_debug(f"Error re-initializing video capture for {file_path}: {e}", exc_info=True)
         with app_globals.video_access_lock: # Ensure cleanup on error
-            if app_globals.video_capture_global:
-                app_globals.video_capture_global.release()
+            evict_cached_captures(keep_paths=set(app_globals.video_capture_cache) - {file_path})
+            release_capture(app_globals.video_capture_global)
             app_globals.video_capture_global = None
-        app_globals.current_video_meta.clear() # Clear metadata on failure
+        clear_video_meta() # Clear metadata on failure
     
     return success
\ No newline at end of file
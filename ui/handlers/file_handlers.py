@@ -3,19 +3,36 @@ File Handlers Module
 Handles file upload operations and custom model file selection.
 """
 import os
-import threading
-from tkinter import filedialog, messagebox
+from tkinter import filedialog
 
 from . import shared_refs as refs
 from . import loading_manager
 from . import file_async
 from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
-from app.processing.model_loader import set_custom_model_path, get_custom_model_path
+from app.processing.model_loader import set_custom_model_path, get_custom_model_path, evict_cached_model
 from . import model_async
 
 log_debug("ui.handlers.file_handlers module initialized.")
 
+UPLOAD_LABEL_MAX_CHARS = 50
+MODEL_LABEL_MAX_CHARS = 35
+_MEDIA_FILE_TYPES = (
+    ("Media files", "*.jpg *.jpeg *.png *.mp4 *.avi *.mov *.mkv"),
+    ("Images", "*.jpg *.jpeg *.png"),
+    ("Videos", "*.mp4 *.avi *.mov *.mkv"),
+    ("All files", "*.*"),
+)
+_MODEL_FILE_TYPES = (
+    ("PyTorch Model files", "*.pt"),
+    ("All files", "*.*"),
+)
+
+
+def _truncate_label(text, max_chars):
+    """Shorten text to fit a label, marking the cut with an ellipsis."""
+    return text if len(text) < max_chars else text[:max_chars - 3] + "..."
+
 
 def handle_file_upload(stop_all_processing_logic_ref):
     """Handle file upload button click."""
@@ -28,31 +45,31 @@ def handle_file_upload(stop_all_processing_logic_ref):
     
     file_path = filedialog.askopenfilename(
         title="Select Image or Video",
-        filetypes=[
-            ("Media files", "*.jpg *.jpeg *.png *.mp4 *.avi *.mov *.mkv"),
-            ("Images", "*.jpg *.jpeg *.png"), 
-            ("Videos", "*.mp4 *.avi *.mov *.mkv"),
-            ("All files", "*.*")
-        ]
+        initialdir=app_globals.last_upload_dir,
+        filetypes=_MEDIA_FILE_TYPES
     )
     
     if not file_path:
         log_debug("handle_file_upload: No file selected.")
         return
 
-    file_name = os.path.basename(file_path)
+    upload_dir, file_name = os.path.split(file_path)
+    app_globals.last_upload_dir = upload_dir
     log_debug(f"handle_file_upload: File selected: {file_path}")
+    app_globals.playback_start_token += 1 # A playback start still opening the previous file must not publish it
+    app_globals.frame_skip_stride = 1
     if ui_comps.get("file_upload_label"):
-        ui_comps["file_upload_label"].config(text=file_name if len(file_name) < 50 else file_name[:47]+"...")
+        ui_comps["file_upload_label"].config(text=_truncate_label(file_name, UPLOAD_LABEL_MAX_CHARS))
     
+    # Show the loader first and start the worker once Tk has painted it, without forcing a redraw here.
     loading_manager.show_loading("Processing uploaded file...") 
-    if root and root.winfo_exists(): 
-        root.update() 
-    
-    threading.Thread(target=file_async._process_uploaded_file_in_thread, 
-                     args=(file_path, stop_all_processing_logic_ref), 
-                     daemon=True).start()
-    log_debug(f"File upload: Worker thread started for {file_path}.")
+    root.after_idle(_start_upload_worker, file_path, stop_all_processing_logic_ref)
+
+
+def _start_upload_worker(file_path, stop_all_processing_logic_ref):
+    """Start the background thread that processes an uploaded file."""
+    refs.submit_background(file_async._process_uploaded_file_in_thread, file_path, stop_all_processing_logic_ref)
+    log_debug(f"File upload: Worker job submitted for {file_path}.")
 
 
 def handle_custom_model_upload(stop_all_processing_logic_ref):
@@ -66,10 +83,7 @@ def handle_custom_model_upload(stop_all_processing_logic_ref):
     
     file_path = filedialog.askopenfilename(
         title="Select Custom YOLO Model (.pt file)",
-        filetypes=[
-            ("PyTorch Model files", "*.pt"),
-            ("All files", "*.*")
-        ]
+        filetypes=_MODEL_FILE_TYPES
     )
     
     if not file_path:
@@ -79,13 +93,14 @@ def handle_custom_model_upload(stop_all_processing_logic_ref):
     file_name = os.path.basename(file_path)
     log_debug(f"handle_custom_model_upload: Model file selected: {file_path}")
     
+    # The weights at this path may have changed since they were cached; load them from disk again
+    evict_cached_model("Select Custom Model")
     # Update the custom model path in the model loader
     set_custom_model_path(file_path)
     
     # Update the UI label
     if ui_comps.get("custom_model_label"):
-        display_name = file_name if len(file_name) < 35 else file_name[:32]+"..."
-        ui_comps["custom_model_label"].config(text=display_name)
+        ui_comps["custom_model_label"].config(text=_truncate_label(file_name, MODEL_LABEL_MAX_CHARS))
     
     # If "Select Custom Model" is currently selected, reload the model
     if ui_comps.get("model_var") and ui_comps["model_var"].get() == "Select Custom Model":
@@ -2,15 +2,11 @@
 Model Async Operations Module
 Handles model loading operations in separate threads.
 """
-import threading
-import cv2
-
 from . import shared_refs as refs
 from . import loading_manager
 from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
 from app.processing.model_loader import load_model
-from app.processing.frame_processor import process_frame_yolo
 from . import file_async
 
 log_debug("ui.handlers.model_async module initialized.")
@@ -51,15 +47,11 @@ def run_model_load_in_thread(selected_model_key, stop_all_processing_logic_ref):
                     app_globals.current_uploaded_file_path_global.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp', '.tiff'))):
                     
                     original_image_path = app_globals.current_uploaded_file_path_global
-                    img_to_reprocess = cv2.imread(original_image_path)
+                    img_to_reprocess = file_async.get_uploaded_image_bgr()
                     
                     if img_to_reprocess is not None:
                         log_debug(f"Re-processing image {original_image_path} with new model {selected_model_key}")
-                        processed_img, detected_count = process_frame_yolo(
-                            img_to_reprocess, app_globals.active_model_object_global, app_globals.active_class_list_global,
-                            is_video_mode=False, active_filter_list=app_globals.active_processed_class_filter_global,
-                            current_conf_thresh=app_globals.conf_threshold_global, current_iou_thresh=app_globals.iou_threshold_global
-                        )
+                        processed_img, detected_count = file_async.process_image_with_thresholds(img_to_reprocess)
                         app_globals.current_processed_image_for_display = processed_img
                         if ui_comps and ui_comps.get("video_display"):
                              ui_comps["video_display"].update_frame(processed_img)
@@ -80,6 +72,5 @@ def run_model_load_in_thread(selected_model_key, stop_all_processing_logic_ref):
     
     loading_manager.show_loading(f"Loading model: {selected_model_key}...")
     
-    model_thread = threading.Thread(target=load_model_task, daemon=True)
-    model_thread.start()
-    log_debug(f"Model loading thread started for {selected_model_key}")
\ No newline at end of file
+    refs.submit_background(load_model_task)
+    log_debug(f"Model loading job submitted for {selected_model_key}")
\ No newline at end of file
@@ -3,13 +3,14 @@ Model Handlers Module
 Handles model selection, validation, and related UI interactions.
 """
 import os
-from tkinter import messagebox
 
 from . import shared_refs as refs
 from . import model_async
+from . import threshold_handlers
+from . import loading_manager
 from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
-from app.processing.model_loader import get_custom_model_path
+from app.processing.model_loader import get_custom_model_path, activate_cached_model
 
 log_debug("ui.handlers.model_handlers module initialized.")
 
@@ -36,7 +37,7 @@ def handle_model_selection_change(stop_all_processing_logic_ref, *args):
         custom_path = get_custom_model_path()
         if not custom_path or not os.path.exists(custom_path):
             log_debug("Custom model selected but no valid .pt file has been chosen.")
-            messagebox.showwarning("Custom Model", "Please select a valid .pt model file using the 'Browse .pt File' button.")
+            refs.show_toast("Custom Model", "Please select a valid .pt model file using the 'Browse .pt File' button.", "warning")
             return
     
     if selected_model == app_globals.active_model_key and app_globals.active_model_object_global is not None:
@@ -44,9 +45,26 @@ def handle_model_selection_change(stop_all_processing_logic_ref, *args):
         return
 
     log_debug(f"Selected model for loading: {selected_model}")
+    if not _is_video_loaded() and activate_cached_model(selected_model):
+        # Cache hit: no weights to read, so skip the loading thread and overlay entirely.
+        log_debug(f"Model {selected_model} switched from cache without a loading thread.")
+        if stop_all_processing_logic_ref:
+            stop_all_processing_logic_ref()
+        threshold_handlers.request_image_reprocess()
+        loading_manager.hide_loading_and_update_controls()
+        return
+
+    # Videos still go through the thread: the capture is re-opened and the first frame re-processed,
+    # but load_model itself returns straight from the cache on a hit.
     model_async.run_model_load_in_thread(selected_model, stop_all_processing_logic_ref)
 
 
+def _is_video_loaded():
+    """Check whether the current upload is a video."""
+    file_info = app_globals.uploaded_file_info
+    return bool(file_info and file_info.get('file_type') == 'video')
+
+
 def validate_custom_model_selection():
     """Validate that a custom model file has been selected when custom model is chosen."""
     ui_comps = refs.ui_components
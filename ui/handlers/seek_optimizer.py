@@ -1,17 +1,21 @@
 """
 Seek Optimizer Module
-Handles high-performance video seeking with debouncing, thread management, and race condition prevention.
+Handles high-performance video seeking with a single long-lived worker, request coalescing, and race condition prevention.
 """
+import queue
 import threading
 import time
-import cv2
+import tkinter as tk
 from collections import deque
 
 from . import shared_refs as refs
+from app import config
 from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
 from app.processing.frame_processor import process_frame_yolo
-from app.processing.video_handler import format_time_display
+from app.processing.video_handler import (
+    format_time_display, seek_and_read, seek_capture, get_cached_capture, get_preview_path, av_seek_and_read,
+)
 
 log_debug("ui.handlers.seek_optimizer module initialized.")
 
@@ -20,18 +24,19 @@ class SeekOptimizer:
     """High-performance seek manager with debouncing and thread optimization."""
     
     def __init__(self):
-        self.seek_queue = deque(maxlen=1)  # Only keep the latest seek request
-        self.current_seek_thread = None
+        self.seek_queue = queue.Queue(maxsize=1)  # Only keep the latest seek request
+        self.worker_thread = None
+        self.display_queue = queue.Queue(maxsize=1)  # Latest decoded seek frame awaiting inference/display
+        self.display_thread = None
+        self.latest_request_id = 0
+        self.cancel_generation = 0  # Bumped by cancel_all_operations so a request waiting out its settle delay is dropped
         self.seek_cancel_event = threading.Event()
-        self.seek_lock = threading.Lock()
-        self.debounce_timer = None
         self.last_seek_time = 0.0
         self.is_seeking = False
+        self._in_flight_lock = threading.Lock()  # Makes "dequeue and mark in flight" atomic with respect to _submit
         
         # Performance settings
-        self.DEBOUNCE_DELAY_MS = 50  # 50ms debounce for rapid interactions
-        self.MIN_SEEK_INTERVAL = 0.02  # 20ms minimum between seeks
-        self.MAX_CONCURRENT_SEEKS = 1
+        self.COALESCE_DELAY_S = config.SLIDER_SEEK_DEBOUNCE_MS / 1000  # Worker-side settle time for non-immediate requests
         
         # Performance monitoring
         self.stats = {
@@ -53,12 +58,12 @@ class SeekOptimizer:
         
     def request_seek(self, target_frame, is_real_time_mode=False, force_immediate=False):
         """
-        Request a seek operation with intelligent debouncing and optimization.
+        Request a seek operation; the latest request overwrites any pending one.
         
         Args:
             target_frame: Target frame number to seek to
             is_real_time_mode: Whether real-time processing should be applied
-            force_immediate: Skip debouncing for immediate seek (e.g., play button)
+            force_immediate: Skip the worker's coalescing delay (e.g., click events)
         """
         current_time = time.perf_counter()
         
@@ -66,7 +71,7 @@ class SeekOptimizer:
         self.stats['total_requests'] += 1
         
         # Validate frame bounds
-        total_frames = app_globals.current_video_meta.get('total_frames', 0)
+        total_frames = app_globals.video_meta_snapshot.total_frames
         if total_frames <= 0:
             log_debug("SeekOptimizer: Invalid total frames, ignoring seek request")
             return
@@ -78,95 +83,71 @@ class SeekOptimizer:
             log_debug(f"SeekOptimizer: Already at frame {target_frame}, skipping seek")
             return
         
-        # Update queue with latest request (automatic debouncing via maxlen=1)
         seek_request = {
             'frame': target_frame,
             'real_time': is_real_time_mode,
             'timestamp': current_time,
             'force_immediate': force_immediate,
-            'request_id': self.stats['total_requests']
+            'request_id': self.stats['total_requests'],
+            'cancel_generation': self.cancel_generation
         }
         
-        with self.seek_lock:
-            # Track queue drops
-            if self.seek_queue:
-                self.stats['queue_drops'] += 1
-            self.seek_queue.clear()
-            self.seek_queue.append(seek_request)
-            
-        # Handle immediate vs debounced execution
-        if force_immediate or (current_time - self.last_seek_time) > self.MIN_SEEK_INTERVAL:
+        if force_immediate:
             self.stats['immediate_requests'] += 1
-            self._execute_seek_immediate()
-        else:
-            self.stats['debounced_requests'] += 1
-            self._schedule_debounced_seek()
+        self.latest_request_id = seek_request['request_id']
+        self._submit(seek_request)
     
-    def _schedule_debounced_seek(self):
-        """Schedule a debounced seek execution."""
-        root = refs.get_root()
-        if not root or not root.winfo_exists():
-            return
-            
-        # Cancel existing timer
-        if self.debounce_timer:
+    def _submit(self, seek_request):
+        """Hand a request to the seek worker, overwriting any request it has not picked up yet."""
+        with self._in_flight_lock:
+            # Abort an in-flight seek first so the worker moves on to this request quickly
+            if self.is_seeking:
+                self.seek_cancel_event.set()
+                self.stats['cancelled_seeks'] += 1
             try:
-                root.after_cancel(self.debounce_timer)
-            except:
+                self.seek_queue.get_nowait()
+                self.stats['queue_drops'] += 1
+            except queue.Empty:
                 pass
-                
-        # Schedule new execution
-        self.debounce_timer = root.after(self.DEBOUNCE_DELAY_MS, self._execute_seek_from_timer)
-    
-    def _execute_seek_from_timer(self):
-        """Execute seek from timer callback (runs on main thread)."""
-        self.debounce_timer = None
-        self._execute_seek_immediate()
-    
-    def _execute_seek_immediate(self):
-        """Execute the latest seek request immediately."""
-        with self.seek_lock:
-            if not self.seek_queue:
+            try:
+                self.seek_queue.put_nowait(seek_request)
+            except queue.Full:
+                self.stats['queue_drops'] += 1
                 return
-                
-            seek_request = self.seek_queue.popleft()
-        
-        # Cancel any existing seek operation
-        self._cancel_current_seek()
-        
-        # Performance monitoring
+        self._ensure_worker()
+    
+    def _ensure_worker(self):
+        """Start the long-lived seek worker thread if it is not running."""
+        if self.worker_thread and self.worker_thread.is_alive():
+            return
         self.stats['thread_spawns'] += 1
-        seek_request['start_time'] = time.perf_counter()
-        
-        # Start new seek operation
-        self.seek_cancel_event.clear()
-        self.current_seek_thread = threading.Thread(
-            target=self._seek_worker,
-            args=(seek_request,),
-            daemon=True,
-            name=f"SeekWorker-{seek_request['frame']}-{seek_request['request_id']}"
-        )
-        
-        self.is_seeking = True
-        self.last_seek_time = time.perf_counter()
-        self.current_seek_thread.start()
-        
-        log_debug(f"SeekOptimizer: Started seek to frame {seek_request['frame']} (ID: {seek_request['request_id']})")
+        self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True, name="SeekWorker")
+        self.worker_thread.start()
+        log_debug("SeekOptimizer: Seek worker thread started")
     
-    def _cancel_current_seek(self):
-        """Cancel the current seek operation if running."""
-        if self.current_seek_thread and self.current_seek_thread.is_alive():
-            log_debug("SeekOptimizer: Cancelling previous seek operation")
-            self.seek_cancel_event.set()
-            self.stats['cancelled_seeks'] += 1
-            
-            # Give it a moment to cancel gracefully
-            self.current_seek_thread.join(timeout=0.1)
-            
-            if self.current_seek_thread.is_alive():
-                log_debug("SeekOptimizer: Previous seek did not cancel in time")
-                
-        self.current_seek_thread = None
+    def _worker_loop(self):
+        """Serve seek requests one at a time for the lifetime of the application."""
+        while True:
+            seek_request = self.seek_queue.get()
+            if not seek_request['force_immediate']:
+                # Quiescence gate on the request's own timestamp: no Tk timers on the UI side.
+                # A newer request supersedes this one and restarts the wait from its timestamp.
+                remaining_s = seek_request['timestamp'] + self.COALESCE_DELAY_S - time.perf_counter()
+                if remaining_s > 0:
+                    time.sleep(remaining_s)
+                if not self.seek_queue.empty():
+                    self.stats['debounced_requests'] += 1
+                    continue
+            with self._in_flight_lock:
+                # A request submitted since the get() saw is_seeking False and did not cancel; let it win instead.
+                if not self.seek_queue.empty() or seek_request['cancel_generation'] != self.cancel_generation:
+                    continue
+                self.seek_cancel_event.clear()
+                self.is_seeking = True
+            self.last_seek_time = time.perf_counter()
+            seek_request['start_time'] = self.last_seek_time
+            log_debug(f"SeekOptimizer: Started seek to frame {seek_request['frame']} (ID: {seek_request['request_id']})")
+            self._seek_worker(seek_request)
     
     def _seek_worker(self, seek_request):
         """
@@ -184,6 +165,14 @@ class SeekOptimizer:
                 log_debug(f"SeekOptimizer: Seek to {target_frame} cancelled before start")
                 return
             
+            preview_path = get_preview_path()
+            if preview_path and not is_real_time_mode:
+                self._preview_seek(preview_path, seek_request)
+                return
+            if not is_real_time_mode:
+                # No MJPEG preview yet: show the nearest keyframe now, the exact frame below replaces it.
+                self._keyframe_preview(seek_request)
+            
             # Perform the seek operation with video access lock
             with app_globals.video_access_lock:
                 if self.seek_cancel_event.is_set():
@@ -193,13 +182,8 @@ class SeekOptimizer:
                     log_debug("SeekOptimizer: Video capture not available")
                     return
                 
-                # Perform the actual seek
-                app_globals.video_capture_global.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-                
-                if self.seek_cancel_event.is_set():
-                    return
-                    
-                ret, frame = app_globals.video_capture_global.read()
+                # Perform the actual seek; only the target frame is retrieved
+                ret, frame = seek_and_read(app_globals.video_capture_global, target_frame, self.seek_cancel_event)
                 
                 if not ret or frame is None:
                     log_debug(f"SeekOptimizer: Failed to read frame {target_frame}")
@@ -211,31 +195,9 @@ class SeekOptimizer:
                 # Update global state
                 app_globals.current_frame_number_global = target_frame
                 app_globals.current_video_meta['current_frame'] = target_frame
-                
-                # Process frame if in real-time mode
-                display_frame = frame.copy()
-                if is_real_time_mode and app_globals.active_model_object_global:
-                    if self.seek_cancel_event.is_set():
-                        return
-                        
-                    try:
-                        display_frame, _ = process_frame_yolo(
-                            frame, app_globals.active_model_object_global, app_globals.active_class_list_global,
-                            is_video_mode=True, active_filter_list=app_globals.active_processed_class_filter_global,
-                            current_conf_thresh=app_globals.conf_threshold_global, current_iou_thresh=app_globals.iou_threshold_global
-                        )
-                    except Exception as e:
-                        log_debug(f"SeekOptimizer: Error processing frame: {e}")
-                        display_frame = frame.copy()
             
-            # Check for cancellation before UI update
-            if self.seek_cancel_event.is_set():
-                return
-                
-            # Schedule UI update on main thread
-            root = refs.get_root()
-            if root and root.winfo_exists():
-                root.after(0, lambda: self._update_ui_after_seek(display_frame, target_frame))
+            # Inference and display run on the display thread so this worker is free for the next seek
+            self._submit_for_display(frame, target_frame, seek_request['request_id'], is_real_time_mode, seek_request['cancel_generation'])
                 
             # Performance monitoring
             if 'start_time' in seek_request:
@@ -253,39 +215,123 @@ class SeekOptimizer:
         finally:
             self.is_seeking = False
     
-    def _update_ui_after_seek(self, display_frame, target_frame):
+    def _submit_for_display(self, frame, target_frame, request_id, is_real_time_mode, generation):
+        """Hand a decoded seek frame to the display thread, dropping any frame it has not taken yet."""
+        item = (frame, target_frame, request_id, is_real_time_mode, generation)
+        try:
+            self.display_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self.display_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.display_queue.put_nowait(item)
+        if self.display_thread is None or not self.display_thread.is_alive():
+            self.display_thread = threading.Thread(target=self._display_loop, daemon=True, name="SeekDisplay")
+            self.display_thread.start()
+    
+    def _display_loop(self):
+        """Run real-time inference on seek frames and post them to Tk, skipping superseded requests."""
+        while True:
+            frame, target_frame, request_id, is_real_time_mode, generation = self.display_queue.get()
+            if request_id != self.latest_request_id:
+                continue  # A newer seek was requested; its frame will follow
+            
+            display_frame = frame
+            if is_real_time_mode and app_globals.active_model_object_global:
+                try:
+                    display_frame, _ = process_frame_yolo(
+                        frame, app_globals.active_model_object_global, app_globals.active_class_list_global,
+                        is_video_mode=True, active_filter_list=app_globals.active_processed_class_filter_global,
+                        current_conf_thresh=app_globals.conf_threshold_global, current_iou_thresh=app_globals.iou_threshold_global
+                    )
+                except Exception as e:
+                    log_debug(f"SeekOptimizer: Error processing frame: {e}")
+            
+            if request_id != self.latest_request_id:
+                continue
+            self._post_seek_frame(display_frame, target_frame, generation)
+    
+    def _preview_seek(self, preview_path, seek_request):
+        """Show target_frame from the MJPEG preview, then position the original capture for playback."""
+        target_frame = seek_request['frame']
+        with app_globals.video_access_lock:
+            preview_cap = get_cached_capture(preview_path)
+            if preview_cap is None:
+                return
+            # Every MJPEG frame is a keyframe, so this seek decodes exactly one frame.
+            ret, frame = seek_and_read(preview_cap, target_frame, self.seek_cancel_event)
+        if not ret or frame is None or self.seek_cancel_event.is_set():
+            return
+        
+        self._post_seek_frame(frame, target_frame, seek_request['cancel_generation'])
+        
+        # The original (inter-frame coded) capture catches up in the background; a newer seek cancels it.
+        with app_globals.video_access_lock:
+            cap = app_globals.video_capture_global
+            if cap is not None and cap.isOpened() and seek_capture(cap, target_frame, self.seek_cancel_event):
+                app_globals.current_frame_number_global = target_frame
+                app_globals.current_video_meta['current_frame'] = target_frame
+        
+        seek_duration = time.perf_counter() - seek_request['start_time']
+        self._record_seek_performance(seek_duration, True)
+        log_debug(f"SeekOptimizer: Preview seek to frame {target_frame} in {seek_duration:.3f}s")
+    
+    def _keyframe_preview(self, seek_request):
+        """Show the keyframe at or before the target via PyAV while the exact seek decodes forward."""
+        target_frame = seek_request['frame']
+        with app_globals.video_access_lock:
+            ret, frame = av_seek_and_read(
+                app_globals.current_uploaded_file_path_global, target_frame,
+                app_globals.video_meta_snapshot.total_frames, exact=False, cancel_event=self.seek_cancel_event
+            )
+        if not ret or self.seek_cancel_event.is_set():
+            return
+        self._post_seek_frame(frame, target_frame, seek_request['cancel_generation'])
+    
+    def _post_seek_frame(self, frame, target_frame, generation):
+        """Queue frame for display on the Tk thread (called from the seek threads)."""
+        if generation != self.cancel_generation:
+            return  # Cancelled (e.g. by Stop) after this frame was decoded
+        root = refs.get_root()
+        if root is None:
+            return
+        # Skips winfo_exists(): from a worker thread it is a blocking round trip to the Tk thread.
+        try:
+            root.after_idle(self._update_ui_after_seek, frame, target_frame, generation)
+        except (RuntimeError, tk.TclError):
+            pass # Window closed, or the main loop has exited
+    
+    def _update_ui_after_seek(self, display_frame, target_frame, generation):
         """Update UI after seek completion (runs on main thread)."""
+        if generation != self.cancel_generation:
+            return  # Stop ran after this frame was posted; keep its reset display
         try:
             ui_comps = refs.ui_components
             if not ui_comps:
                 return
                 
-            # Update video display
-            if ui_comps.get("video_display") and display_frame is not None:
-                ui_comps["video_display"].update_frame(display_frame)
+            # Build label text first so the widget updates below run back-to-back in this one idle callback
+            meta = app_globals.video_meta_snapshot
+            current_time_sec = target_frame / meta.fps if meta.fps > 0 else 0
+            time_text = format_time_display(current_time_sec, meta.duration_s)
+            frame_text = f"Frame: {target_frame} / {meta.total_frames}"
             
-            # Update progress slider
-            total_frames = app_globals.current_video_meta.get('total_frames', 0)
-            if total_frames > 0:
-                # Temporarily disable slider updates to prevent feedback loop
-                app_globals.is_programmatic_slider_update = True
-                try:
-                    if ui_comps.get("progress_var"):
-                        # Use frame number directly since slider is configured with frame range
-                        ui_comps["progress_var"].set(target_frame)
-                finally:
-                    app_globals.is_programmatic_slider_update = False
+            video_display = ui_comps.get("video_display")
+            if video_display and display_frame is not None:
+                video_display.update_frame(display_frame)
             
-            # Update time and frame labels
-            fps = app_globals.current_video_meta.get('fps', 30.0)
-            current_time_sec = target_frame / fps if fps > 0 else 0
-            total_time_sec = app_globals.current_video_meta.get('duration_seconds', 0)
+            # Update progress slider
+            if meta.total_frames > 0:
+                # Use frame number directly since slider is configured with frame range
+                refs.set_progress_silently(target_frame)
             
-            if ui_comps.get("time_label"):
-                ui_comps["time_label"].config(text=format_time_display(current_time_sec, total_time_sec))
-                
-            if ui_comps.get("current_frame_label"):
-                ui_comps["current_frame_label"].config(text=f"Frame: {target_frame} / {total_frames}")
+            time_label = ui_comps.get("time_label")
+            if time_label:
+                time_label.config(text=time_text)
+            frame_label = ui_comps.get("current_frame_label")
+            if frame_label:
+                frame_label.config(text=frame_text)
                 
         except Exception as e:
             log_debug(f"SeekOptimizer: Error updating UI after seek: {e}", exc_info=True)
@@ -316,15 +362,6 @@ class SeekOptimizer:
                 'success': False
             })
     
-    def get_status(self):
-        """Get current status for debugging."""
-        return {
-            'is_seeking': self.is_seeking,
-            'queue_size': len(self.seek_queue),
-            'has_active_thread': self.current_seek_thread and self.current_seek_thread.is_alive(),
-            'last_seek_time': self.last_seek_time
-        }
-        
     def get_performance_stats(self):
         """Get detailed performance statistics."""
         uptime = time.perf_counter() - self.start_time
@@ -387,34 +424,28 @@ class SeekOptimizer:
         """Cancel all pending and active seek operations."""
         log_debug("SeekOptimizer: Cancelling all seek operations")
         
-        # Cancel debounce timer
-        root = refs.get_root()
-        if self.debounce_timer and root and root.winfo_exists():
+        # Drop the pending request and abort the current seek; the worker stays alive
+        with self._in_flight_lock:
+            self.cancel_generation += 1
+            self.latest_request_id = None  # No request is current, so a frame already handed to display is dropped
             try:
-                root.after_cancel(self.debounce_timer)
-            except:
+                self.seek_queue.get_nowait()
+            except queue.Empty:
                 pass
-            self.debounce_timer = None
-        
-        # Cancel current seek
-        self._cancel_current_seek()
-        
-        # Clear queue
-        with self.seek_lock:
-            self.seek_queue.clear()
-        
-        self.is_seeking = False
+            if self.is_seeking:
+                self.seek_cancel_event.set()
+                self.stats['cancelled_seeks'] += 1
     
     def is_busy(self):
         """Check if seek optimizer is currently processing."""
-        return self.is_seeking or bool(self.seek_queue)
+        return self.is_seeking or not self.seek_queue.empty()
     
     def get_status(self):
         """Get current status for debugging."""
         return {
             'is_seeking': self.is_seeking,
-            'queue_size': len(self.seek_queue),
-            'has_active_thread': self.current_seek_thread and self.current_seek_thread.is_alive(),
+            'queue_size': self.seek_queue.qsize(),
+            'has_active_thread': bool(self.worker_thread and self.worker_thread.is_alive()),
             'last_seek_time': self.last_seek_time
         }
 
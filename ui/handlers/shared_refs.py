@@ -3,7 +3,13 @@
 Module to hold shared references for the Tkinter UI callback system.
 This helps avoid circular dependencies and makes shared state explicit.
 """
+import queue
+import threading
+import tkinter as tk
+from app import config
+from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
+from app.ui.custom_widgets import ToastNotification
 
 log_debug("ui.handlers.shared_refs module initialized.")
 
@@ -11,12 +17,25 @@ log_debug("ui.handlers.shared_refs module initialized.")
 ui_components = {}
 root_window = None
 loading_overlay = None # Managed by functions in _ui_loading_manager
+_button_state_cache = {} # Last disabled state applied per button key
+_progress_slider_to = None # Last 'to' applied to the progress slider; its state is also set elsewhere, so it is not cached
+_root_cache_invalidators = [] # Callbacks that drop module-level memoized root references
+# Shared daemon workers for one-shot jobs (upload, image inference, model load). ThreadPoolExecutor is
+# not used: its workers are joined at interpreter exit, so closing the window would wait for the job.
+_io_jobs = queue.SimpleQueue()
+_io_workers = []
+_io_workers_lock = threading.Lock()
+
 
 def init_shared_refs(components_dict, root_ref):
     """Initialize the shared UI component dictionary and root window reference."""
-    global ui_components, root_window
+    global ui_components, root_window, _progress_slider_to
     ui_components = components_dict
     root_window = root_ref
+    _button_state_cache.clear()
+    _progress_slider_to = None
+    for callback in _root_cache_invalidators:
+        callback()
 
 def get_component(name):
     """Access a UI component by its name."""
@@ -26,10 +45,67 @@ def get_root():
     """Access the root window."""
     return root_window
 
+def register_root_cache_invalidator(callback):
+    """Register a callback that clears a memoized root window reference."""
+    _root_cache_invalidators.append(callback)
+
+def invalidate_root_cache():
+    """Drop the root window reference and every memoized copy of it (app teardown)."""
+    global root_window
+    root_window = None
+    for callback in _root_cache_invalidators:
+        callback()
+
 def get_ui_refs():
     """Access the shared UI components dictionary."""
     return ui_components
 
+def set_button_state(key, disabled):
+    """Enable or disable a ttk button (or threshold scale) by key, skipping the Tk call when the state is unchanged."""
+    disabled = bool(disabled)
+    if _button_state_cache.get(key) is disabled:
+        return
+    button = ui_components.get(key)
+    if button is None:
+        return
+    button.state(['disabled' if disabled else '!disabled'])
+    _button_state_cache[key] = disabled
+
+def set_model_buttons_state(disabled):
+    """Enable or disable all model radiobuttons, skipping the Tk calls when their state is unchanged."""
+    disabled = bool(disabled)
+    if _button_state_cache.get("model_buttons") is disabled:
+        return
+    new_state = ['disabled' if disabled else '!disabled']
+    for button in ui_components.get("model_buttons", []):
+        if button:
+            button.state(new_state)
+    _button_state_cache["model_buttons"] = disabled
+
+def set_progress_slider_range(total_frames):
+    """Enable the progress slider over 0..total_frames-1, or disable it when there are no frames, in one Tk call."""
+    global _progress_slider_to
+    slider = ui_components.get("progress_slider")
+    if slider is None:
+        return
+    to = total_frames - 1 if total_frames > 0 else 100
+    if to == _progress_slider_to:
+        slider.config(state="normal" if total_frames > 0 else "disabled") # Same range: skip the Scale relayout
+    else:
+        slider.config(state="normal" if total_frames > 0 else "disabled", to=to)
+        _progress_slider_to = to
+
+def set_progress_silently(frame_number):
+    """Move the progress slider without running its seek trace (the trace fires synchronously inside set())."""
+    progress_var = ui_components.get("progress_var")
+    if progress_var is None:
+        return
+    app_globals.is_programmatic_slider_update = True
+    try:
+        progress_var.set(frame_number)
+    finally:
+        app_globals.is_programmatic_slider_update = False
+
 def get_loading_overlay_ref():
     """Get the current loading overlay instance."""
     global loading_overlay
@@ -39,3 +115,49 @@ def set_loading_overlay_ref(overlay_instance):
     """Set the current loading overlay instance."""
     global loading_overlay
     loading_overlay = overlay_instance
+
+def show_toast(title, msg, level="info"):
+    """Show a non-blocking toast notification that dismisses itself."""
+    log_debug(f"Toast ({level}): {title} - {msg}")
+    if root_window is None:
+        return None
+    if threading.current_thread() is not threading.main_thread():
+        # Tk widgets may only be created on the Tk thread; post and return without a handle.
+        try:
+            root_window.after(0, show_toast, title, msg, level)
+        except (RuntimeError, tk.TclError):
+            pass # Window closed, or the main loop has exited
+        return None
+    if not root_window.winfo_exists():
+        return None
+    try:
+        return ToastNotification(root_window, title, msg, level)
+    except tk.TclError as e:
+        log_debug(f"Could not show toast '{title}': {e}", exc_info=True)
+        return None
+
+def _run_logged(func, args):
+    """Run func(*args), logging any exception that escapes it."""
+    try:
+        func(*args)
+    except Exception as e:
+        log_debug(f"Background job {getattr(func, '__name__', func)} failed: {e}", exc_info=True)
+
+def _io_worker_loop():
+    """Run queued background jobs forever (daemon thread)."""
+    while True:
+        func, args = _io_jobs.get()
+        _run_logged(func, args)
+
+def submit_background(func, *args):
+    """Run a one-shot job on the shared daemon workers instead of spawning a thread per click."""
+    with _io_workers_lock:
+        if len(_io_workers) < config.IO_WORKER_COUNT:
+            worker = threading.Thread(target=_io_worker_loop, daemon=True, name=f"yolo-io-{len(_io_workers)}")
+            worker.start()
+            _io_workers.append(worker)
+    _io_jobs.put((func, args))
+
+def run_in_daemon_thread(func, *args):
+    """Run a latency-sensitive job on its own daemon thread so it never queues behind pool jobs."""
+    threading.Thread(target=_run_logged, args=(func, args), daemon=True).start()
@@ -2,100 +2,151 @@
 Threshold Handlers Module
 Handles IoU and confidence threshold slider changes and image reprocessing.
 """
-import cv2
+import queue
+import threading
+import tkinter as tk
 
 from . import shared_refs as refs
+from . import file_async
+from app import config
 from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
-from app.processing.frame_processor import process_frame_yolo
 
 log_debug("ui.handlers.threshold_handlers module initialized.")
 
+_reprocess_debounce_id = None # Shared by both sliders so moving either one restarts the same wait
+_reprocess_queue = queue.Queue(maxsize=1) # Holds only the newest pending reprocess request
+_reprocess_worker = None
+# Output images no longer on screen, handed back by the main thread for the worker to draw into again
+_free_render_buffers = queue.SimpleQueue()
+_displayed_render_buffer = None # Reprocess output currently shown (main thread only)
 
-def handle_iou_change(*args):
-    """Handle IoU threshold slider changes."""
-    log_debug(f"handle_iou_change: IoU slider changed. Args: {args}")
-    
+
+def _is_image_reprocessable():
+    """Check whether an uploaded image and a loaded model are available."""
+    path = app_globals.current_uploaded_file_path_global
+    return bool(path and path.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp', '.tiff'))
+                and app_globals.active_model_object_global)
+
+
+def _schedule_reprocess():
+    """Cancel a pending reprocess and schedule a new one after the debounce interval."""
+    global _reprocess_debounce_id
+    root = refs.get_root()
+    if not root:
+        return
+    if _reprocess_debounce_id is not None:
+        try:
+            root.after_cancel(_reprocess_debounce_id)
+        except tk.TclError:
+            pass # Already fired or cancelled
+    _reprocess_debounce_id = root.after(int(config.SLIDER_DEBOUNCE_INTERVAL * 1000), _do_reprocess)
+
+
+def _do_reprocess():
+    """Queue the current image for reprocessing with the latest thresholds (main thread)."""
+    global _reprocess_debounce_id, _reprocess_worker
+    _reprocess_debounce_id = None
+    if not _is_image_reprocessable():
+        return
+
+    # The worker fetches the image itself: a first-use imread must not run on the Tk thread
+    request = (app_globals.conf_threshold_global, app_globals.iou_threshold_global)
+    try:
+        _reprocess_queue.get_nowait()
+    except queue.Empty:
+        pass
+    _reprocess_queue.put_nowait(request)
+
+    if _reprocess_worker is None or not _reprocess_worker.is_alive():
+        _reprocess_worker = threading.Thread(target=_reprocess_worker_loop, daemon=True)
+        _reprocess_worker.start()
+
+
+def request_image_reprocess():
+    """Reprocess the uploaded image right away, e.g. after the active model changed."""
+    _do_reprocess()
+
+
+def _reprocess_worker_loop():
+    """Run queued threshold reprocesses off the Tk main thread."""
+    while True:
+        conf_thresh, iou_thresh = _reprocess_queue.get()
+        try:
+            img_to_reprocess = file_async.get_uploaded_image_bgr()
+            if img_to_reprocess is None:
+                continue
+            # Only the first request per image/model pays for inference; later ticks re-run NMS on cached candidates.
+            processed_img, detected_count = file_async.process_image_with_thresholds(
+                img_to_reprocess, conf_thresh=conf_thresh, iou_thresh=iou_thresh, out=_take_render_buffer()
+            )
+            root = refs.get_root()
+            if root:
+                root.after(0, _apply_reprocessed_image, processed_img, detected_count)
+        except Exception as e:
+            log_debug(f"Error reprocessing image with new thresholds: {e}", exc_info=True)
+
+
+def _take_render_buffer():
+    """Return a recycled output image for the worker, or None to let it allocate one."""
+    try:
+        return _free_render_buffers.get_nowait()
+    except queue.Empty:
+        return None
+
+
+def _apply_reprocessed_image(processed_img, detected_count):
+    """Show a reprocessed image on the main thread."""
+    global _displayed_render_buffer
+    if not _reprocess_queue.empty():
+        _free_render_buffers.put(processed_img)
+        return  # A newer request supersedes this result
+    previous = _displayed_render_buffer
+    app_globals.current_processed_image_for_display = processed_img
+    video_display = refs.ui_components.get("video_display") if refs.ui_components else None
+    if video_display:
+        video_display.update_frame(processed_img)
+    _displayed_render_buffer = processed_img
+    if previous is not None and previous is not processed_img:
+        _free_render_buffers.put(previous) # Display and globals now point at the new image
+    print(f"Re-processed image with new thresholds. Detected {detected_count} objects.")
+
+
+def _apply_threshold_change(var_key, label_key, global_attr, display_name):
+    """Store a threshold slider's value, update its label and schedule the shared image reprocess."""
     ui_comps = refs.ui_components
-    if not ui_comps or not ui_comps.get("iou_var"):
-        log_debug("IoU change: UI components not available.")
+    if not ui_comps or not ui_comps.get(var_key):
+        log_debug(f"{display_name} change: UI components not available.")
         return
     
     try:
-        new_iou_value = ui_comps["iou_var"].get()
-        app_globals.iou_threshold_global = new_iou_value
+        new_value = ui_comps[var_key].get()
+        setattr(app_globals, global_attr, new_value)
         
-        log_debug(f"IoU threshold changed to {new_iou_value}")
+        log_debug(f"{display_name} threshold changed to {new_value}")
         
         # Update display label
-        if ui_comps.get("iou_value_label"):
-            ui_comps["iou_value_label"].config(text=f"{new_iou_value:.2f}")
+        if ui_comps.get(label_key):
+            ui_comps[label_key].config(text=f"{new_value:.2f}")
         
-        # Reprocess current image if available
-        if (app_globals.current_uploaded_file_path_global and 
-            app_globals.current_uploaded_file_path_global.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp', '.tiff')) and
-            app_globals.active_model_object_global):
-            
-            original_image_path = app_globals.current_uploaded_file_path_global
-            img_to_reprocess = cv2.imread(original_image_path)
-            
-            if img_to_reprocess is not None:
-                processed_img, detected_count = process_frame_yolo(
-                    img_to_reprocess, app_globals.active_model_object_global, app_globals.active_class_list_global,
-                    is_video_mode=False, active_filter_list=app_globals.active_processed_class_filter_global,
-                    current_conf_thresh=app_globals.conf_threshold_global, 
-                    current_iou_thresh=app_globals.iou_threshold_global  
-                )
-                app_globals.current_processed_image_for_display = processed_img 
-                if ui_comps.get("video_display"): 
-                    ui_comps["video_display"].update_frame(processed_img)
-                print(f"Re-processed image with new IoU. Detected {detected_count} objects.")
+        # Reprocess current image once both sliders settle
+        if _is_image_reprocessable():
+            _schedule_reprocess()
         
     except Exception as e:
-        log_debug(f"Error in handle_iou_change: {e}", exc_info=True)
+        log_debug(f"Error handling {display_name} threshold change: {e}", exc_info=True)
+
+
+def handle_iou_change(*args):
+    """Handle IoU threshold slider changes."""
+    log_debug(f"handle_iou_change: IoU slider changed. Args: {args}")
+    _apply_threshold_change("iou_var", "iou_value_label", "iou_threshold_global", "IoU")
 
 
 def handle_conf_change(*args):
     """Handle confidence threshold slider changes."""
     log_debug(f"handle_conf_change: Conf slider changed. Args: {args}")
-    
-    ui_comps = refs.ui_components
-    if not ui_comps or not ui_comps.get("conf_var"):
-        log_debug("Conf change: UI components not available.")
-        return
-    
-    try:
-        new_conf_value = ui_comps["conf_var"].get()
-        app_globals.conf_threshold_global = new_conf_value
-        
-        log_debug(f"Confidence threshold changed to {new_conf_value}")
-        
-        # Update display label
-        if ui_comps.get("conf_value_label"):
-            ui_comps["conf_value_label"].config(text=f"{new_conf_value:.2f}")
-        
-        # Reprocess current image if available
-        if (app_globals.current_uploaded_file_path_global and 
-            app_globals.current_uploaded_file_path_global.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp', '.tiff')) and
-            app_globals.active_model_object_global):
-            
-            original_image_path = app_globals.current_uploaded_file_path_global
-            img_to_reprocess = cv2.imread(original_image_path)
-            
-            if img_to_reprocess is not None:
-                processed_img, detected_count = process_frame_yolo(
-                    img_to_reprocess, app_globals.active_model_object_global, app_globals.active_class_list_global,
-                    is_video_mode=False, active_filter_list=app_globals.active_processed_class_filter_global,
-                    current_conf_thresh=app_globals.conf_threshold_global, 
-                    current_iou_thresh=app_globals.iou_threshold_global  
-                )
-                app_globals.current_processed_image_for_display = processed_img
-                if ui_comps.get("video_display"): 
-                    ui_comps["video_display"].update_frame(processed_img)
-                print(f"Re-processed image with new Conf. Detected {detected_count} objects.")
-        
-    except Exception as e:
-        log_debug(f"Error in handle_conf_change: {e}", exc_info=True)
+    _apply_threshold_change("conf_var", "conf_value_label", "conf_threshold_global", "Confidence")
 
 
 def update_threshold_displays():
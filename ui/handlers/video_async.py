@@ -2,22 +2,114 @@
 Video Async Operations Module
 Handles video playback, seeking, and fast processing operations in separate threads.
 """
+import queue
 import threading
 import time
-import cv2
 import tkinter as tk
 
 from . import shared_refs as refs
 from . import loading_manager
+from . import seek_optimizer
+from app import config
 from app.core import globals as app_globals
 from app.utils.logger_setup import log_debug
 from app.processing.frame_processor import process_frame_yolo
-from app.processing.video_handler import format_time_display, fast_video_processing_thread_func
+from app.processing.video_handler import format_time_display, fast_video_processing_thread_func, ensure_frame_decoder
 
 log_debug("ui.handlers.video_async module initialized.")
 
+_next_frame_deadline_ns = None # perf_counter_ns() time the next playback tick is due
+_last_processing_bound_warning_ns = 0
+_last_progress_update_ns = 0 # perf_counter_ns() of the last slider/label refresh
+PROCESSING_BOUND_WARNING_INTERVAL_NS = 5_000_000_000
+
+
+def _next_playback_delay_ms(fps, stride=1):
+    """Return the after() delay that keeps ticks on the source frame cadence, absorbing per-frame work time."""
+    global _next_frame_deadline_ns
+    frame_interval_ns = stride * (int(1_000_000_000 / fps) if fps > 0 else 33_333_333)
+    now_ns = time.perf_counter_ns()
+    if _next_frame_deadline_ns is None or now_ns - _next_frame_deadline_ns > frame_interval_ns:
+        # First tick, resume after pause, or more than a frame behind: re-anchor instead of bursting to catch up.
+        _next_frame_deadline_ns = now_ns
+    _next_frame_deadline_ns += frame_interval_ns
+    return max(1, (_next_frame_deadline_ns - now_ns) // 1_000_000)
+
+
+def _late_frame_count(fps):
+    """Return how many whole frames this tick is behind its deadline (capped at one second of video)."""
+    if _next_frame_deadline_ns is None or fps <= 0:
+        return 0
+    frame_interval_ns = int(1_000_000_000 / fps)
+    late_frames = (time.perf_counter_ns() - _next_frame_deadline_ns) // frame_interval_ns
+    return max(0, min(late_frames, int(fps)))
+
+
+def _warn_processing_bound(late_frames):
+    """Tell the user real-time inference cannot keep up, at most once every few seconds."""
+    global _last_processing_bound_warning_ns
+    now_ns = time.perf_counter_ns()
+    if now_ns - _last_processing_bound_warning_ns < PROCESSING_BOUND_WARNING_INTERVAL_NS:
+        return
+    _last_processing_bound_warning_ns = now_ns
+    log_debug(f"Video playback loop: processing bound, {late_frames} frame(s) behind source rate.")
+    print("Real-time processing is slower than the video frame rate. Use 'Fast Process' for full-speed output.")
+
+
+def _tune_frame_skip_stride(late_frames, delay_ms, fps):
+    """Widen the real-time read stride while inference falls behind; narrow it again once a tick has a frame of slack."""
+    stride = app_globals.frame_skip_stride
+    if late_frames > 0:
+        stride = min(stride + 1, config.REALTIME_MAX_FRAME_STRIDE)
+    elif stride > 1 and fps > 0 and delay_ms > 1000 / fps:
+        stride -= 1
+    if stride != app_globals.frame_skip_stride:
+        log_debug(f"Video playback loop: real-time read stride {app_globals.frame_skip_stride} -> {stride}.")
+        app_globals.frame_skip_stride = stride
+
+
+def _next_decoded_frame():
+    """Pop the next current-generation (frame_number, frame) from the decoder, or None if none is ready."""
+    while True:
+        try:
+            generation, frame_number, frame = app_globals.frame_queue.get_nowait()
+        except queue.Empty:
+            return None
+        if generation == app_globals.decode_generation:
+            return frame_number, frame
+
+
+def _drop_decoded_frames(max_frames):
+    """Discard up to max_frames queued frames (never the end-of-stream marker). Returns how many were dropped."""
+    dropped = 0
+    while dropped < max_frames and app_globals.frame_queue.qsize() > 1:
+        try:
+            app_globals.frame_queue.get_nowait()
+        except queue.Empty:
+            break
+        dropped += 1
+    return dropped
+
+
+def _update_playback_progress_ui(ui_comps):
+    """Refresh the progress slider and time/frame labels for the current frame."""
+    total_frames = app_globals.video_meta_snapshot.total_frames
+    fps = app_globals.video_meta_snapshot.fps
+    
+    # Use frame numbers directly since slider is configured with frame range
+    refs.set_progress_silently(app_globals.current_frame_number_global)
+    
+    current_time_sec = app_globals.current_frame_number_global / fps if fps > 0 else 0
+    total_time_sec = app_globals.video_meta_snapshot.duration_s
+    ui_comps["time_label"].config(text=format_time_display(current_time_sec, total_time_sec))
+    
+    ui_comps["current_frame_label"].config(text=f"Frame: {app_globals.current_frame_number_global} / {total_frames}")
+    ui_comps["fps_label"].config(text=f"FPS: {fps:.1f}")
+
+
 def _video_playback_loop():
     """Main video playback loop running in root.after() calls."""
+    global _last_progress_update_ns
     root = refs.get_root()
     ui_comps = refs.ui_components
     
@@ -39,77 +131,97 @@ def _video_playback_loop():
         app_globals.after_id_playback_loop = None
         return
     
-    if app_globals.video_paused_flag.is_set():
-        if root.winfo_exists() and app_globals.is_playing_via_after_loop: # Continue polling if paused but meant to be playing
+    if app_globals.video_paused:
+        if _last_progress_update_ns:
+            _last_progress_update_ns = 0
+            _update_playback_progress_ui(ui_comps) # Show the exact paused position
+        if app_globals.is_playing_via_after_loop: # Continue polling if paused but meant to be playing
             app_globals.after_id_playback_loop = root.after(50, _video_playback_loop)
         else:
             # If not supposed to be playing, ensure no reschedule
             app_globals.after_id_playback_loop = None
         return
     
-    with app_globals.video_access_lock:
-        if app_globals.video_capture_global is None or not app_globals.video_capture_global.isOpened():
-            app_globals.is_playing_via_after_loop = False 
-            app_globals.after_id_playback_loop = None
-            return
-        
-        ret, frame = app_globals.video_capture_global.read()
-        if not ret:
-            app_globals.is_playing_via_after_loop = False 
-            app_globals.after_id_playback_loop = None
-            return
-        
-        app_globals.current_frame_number_global = int(app_globals.video_capture_global.get(cv2.CAP_PROP_POS_FRAMES))
-        app_globals.current_video_meta['current_frame'] = app_globals.current_frame_number_global
-        
-        output_frame = frame.copy()
-        
-        # Process frame with YOLO if model is available
-        if app_globals.active_model_object_global:
-            try:
-                output_frame, _ = process_frame_yolo(
-                    output_frame, app_globals.active_model_object_global, app_globals.active_class_list_global,
-                    persist_tracking=True, is_video_mode=True,
-                    active_filter_list=app_globals.active_processed_class_filter_global,
-                    current_conf_thresh=app_globals.conf_threshold_global,
-                    current_iou_thresh=app_globals.iou_threshold_global
-                )
-            except Exception as e_process:
-                log_debug(f"Frame processing error: {e_process}")
-                output_frame = frame
-        
-        # Update UI
-        if ui_comps.get("video_display"):
-            ui_comps["video_display"].update_frame(output_frame)
-        
-        # Update progress and time using video metadata
-        total_frames = app_globals.current_video_meta.get('total_frames', 0)
-        fps = app_globals.current_video_meta.get('fps', 30.0)
-        
-        # Update slider with programmatic flag to prevent feedback loops
-        # Use frame numbers directly since slider is configured with frame range
-        app_globals.is_programmatic_slider_update = True
+    if app_globals.video_capture_global is None or not app_globals.video_capture_global.isOpened():
+        app_globals.is_playing_via_after_loop = False 
+        app_globals.after_id_playback_loop = None
+        return
+    
+    # Decoding runs ahead on a background thread; this tick only consumes, infers and blits.
+    ensure_frame_decoder()
+    
+    late_frames = _late_frame_count(app_globals.video_meta_snapshot.fps)
+    is_processed_output = app_globals.current_uploaded_file_path_global == app_globals.processed_video_temp_file_path_global
+    is_realtime_inference = not is_processed_output and app_globals.active_model_object_global is not None
+    if not is_realtime_inference and app_globals.frame_skip_stride != 1:
+        app_globals.frame_skip_stride = 1 # The decoder applies the stride; plain playback shows every frame
+    if late_frames > 0 and is_processed_output:
+        # Already-processed output: drop the read-ahead frames we are past, and have the
+        # decoder grab() past any remainder without decoding it.
+        app_globals.decoder_skip_frames = late_frames - _drop_decoded_frames(late_frames)
+    elif late_frames > 0 and app_globals.frame_skip_stride == config.REALTIME_MAX_FRAME_STRIDE:
+        _warn_processing_bound(late_frames)
+    
+    decoded = _next_decoded_frame()
+    if decoded is None:
+        # Decoder has not caught up yet; poll again without advancing the frame deadline. A quarter
+        # frame keeps the wake-up rate tied to the source cadence instead of spinning Tk every 1 ms.
+        fps = app_globals.video_meta_snapshot.fps
+        poll_ms = max(1, int(250 / fps)) if fps > 0 else 8
+        app_globals.after_id_playback_loop = root.after(poll_ms, _video_playback_loop)
+        return
+    
+    frame_number, frame = decoded
+    if frame is None:
+        log_debug("Video playback loop: End of stream reached.")
+        app_globals.is_playing_via_after_loop = False 
+        app_globals.after_id_playback_loop = None
+        return
+    
+    app_globals.current_frame_number_global = frame_number
+    app_globals.current_video_meta['current_frame'] = app_globals.current_frame_number_global
+    
+    output_frame = frame
+    
+    # Process frame with YOLO if model is available
+    if app_globals.active_model_object_global:
         try:
-            ui_comps["progress_var"].set(app_globals.current_frame_number_global)
-        finally:
-            app_globals.is_programmatic_slider_update = False
-        
-        current_time_sec = app_globals.current_frame_number_global / fps if fps > 0 else 0
-        total_time_sec = app_globals.current_video_meta.get('duration_seconds', 0)
-        ui_comps["time_label"].config(text=format_time_display(current_time_sec, total_time_sec))
-        
-        ui_comps["current_frame_label"].config(text=f"Frame: {app_globals.current_frame_number_global} / {total_frames}")
-        ui_comps["fps_label"].config(text=f"FPS: {fps:.1f}")
-    
-    if root.winfo_exists():
-        fps = app_globals.current_video_meta.get('fps', 30.0)
-        delay_ms = max(1, int(1000 / fps)) if fps > 0 else 33
-        # Only reschedule if still intended to be playing
-        if app_globals.is_playing_via_after_loop:
-            app_globals.after_id_playback_loop = root.after(delay_ms, _video_playback_loop)
-        else:
-            log_debug("Video playback loop: Playback no longer active at rescheduling point. Not rescheduling.")
-            app_globals.after_id_playback_loop = None
+            output_frame, _ = process_frame_yolo(
+                frame, app_globals.active_model_object_global, app_globals.active_class_list_global,
+                persist_tracking=True, is_video_mode=True,
+                active_filter_list=app_globals.active_processed_class_filter_global,
+                current_conf_thresh=app_globals.conf_threshold_global,
+                current_iou_thresh=app_globals.iou_threshold_global
+            )
+        except Exception as e_process:
+            log_debug(f"Frame processing error: {e_process}")
+            output_frame = frame
+    
+    # Update UI
+    video_display = ui_comps.get("video_display")
+    if video_display:
+        video_display.update_frame(output_frame)
+    
+    # Progress widgets refresh at PLAYBACK_UI_UPDATE_INTERVAL_MS; faster slider motion is imperceptible
+    now_ns = time.perf_counter_ns()
+    if now_ns - _last_progress_update_ns >= config.PLAYBACK_UI_UPDATE_INTERVAL_MS * 1_000_000:
+        _last_progress_update_ns = now_ns
+        _update_playback_progress_ui(ui_comps)
+    
+    # root was checked at the top of this tick; nothing since can destroy it.
+    fps = app_globals.video_meta_snapshot.fps
+    if not is_realtime_inference:
+        delay_ms = _next_playback_delay_ms(fps)
+    else:
+        # Real-time inference: each shown frame stands for frame_skip_stride source frames.
+        delay_ms = _next_playback_delay_ms(fps, app_globals.frame_skip_stride)
+        _tune_frame_skip_stride(late_frames, delay_ms, fps)
+    # Only reschedule if still intended to be playing
+    if app_globals.is_playing_via_after_loop:
+        app_globals.after_id_playback_loop = root.after(delay_ms, _video_playback_loop)
+    else:
+        log_debug("Video playback loop: Playback no longer active at rescheduling point. Not rescheduling.")
+        app_globals.after_id_playback_loop = None
 
 
 def _perform_seek_action_in_thread(target_frame_number, is_real_time_mode=False):
@@ -119,9 +231,6 @@ def _perform_seek_action_in_thread(target_frame_number, is_real_time_mode=False)
     """
     log_debug(f"_perform_seek_action_in_thread (legacy): Delegating to optimized seek system for frame {target_frame_number}")
     
-    # Import here to avoid circular imports
-    from . import seek_optimizer
-    
     # Delegate to the optimized seek system
     seek_optimizer.request_seek(target_frame_number, is_real_time_mode, force_immediate=True)
 
@@ -135,7 +244,6 @@ def run_fast_video_processing_in_thread(uploaded_video_path, stop_all_processing
         return
     
     # Cancel any pending seek operations before starting fast processing
-    from . import seek_optimizer
     seek_optimizer.cancel_all_seeks()
     
     def fast_process_task():
@@ -153,10 +261,6 @@ def run_fast_video_processing_in_thread(uploaded_video_path, stop_all_processing
                 root.after(0, loading_manager.show_fast_processing_progress_ui)
             else:
                 log_debug("fast_process_task: Root window not available for initial UI update.")
-            
-            # Give UI a moment to update before heavy processing starts
-            # This helps ensure the "Starting..." overlay is hidden and progress UI appears quickly.
-            time.sleep(0.1)
 
             success = fast_video_processing_thread_func(
                 uploaded_video_path,